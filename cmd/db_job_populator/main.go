@@ -6,10 +6,10 @@ package main
 import (
 	"context"
 	"encoding/json"
-	"fmt"
 	"os"
 	"os/signal"
 	"path/filepath"
+	"slices"
 	"strings"
 	"syscall"
 	"time"
@@ -86,6 +86,11 @@ func run(ctx context.Context) error {
 		return err
 	}
 
+	// Load the technology catalogue up front so most lookups skip the database
+	if err := preloadTechnologies(ctx, repos, log); err != nil {
+		return err
+	}
+
 	// Process jobs and collect missing technologies
 	missingTechnologies, err := processJobs(ctx, jobData, repos, log)
 	if err != nil {
@@ -120,6 +125,10 @@ func setupDatabase(ctx context.Context, log *logrus.Logger) (*pgxpool.Pool, *rep
 		jobtech: jobtech.NewRepository(dbpool),
 		tech:    technology.NewRepository(dbpool),
 		alias:   techalias.NewRepository(dbpool),
+		cache: &lookupCache{
+			companyIDs:   make(map[string]int),
+			technologies: make(map[string]*technology.Technology),
+		},
 	}
 
 	return dbpool, repos, nil
@@ -132,6 +141,45 @@ type repositories struct {
 	jobtech *jobtech.Repository
 	tech    *technology.Repository
 	alias   *techalias.Repository
+	cache   *lookupCache
+}
+
+// lookupCache memoizes company and technology lookups for the duration of a run.
+// The same companies and technology names repeat across most jobs in a scrape,
+// so only the first occurrence of each name needs a database round trip.
+type lookupCache struct {
+	companyIDs map[string]int
+	// technologies maps a technology name or alias to its technology; a nil
+	// value records a name known to be missing from the database
+	technologies map[string]*technology.Technology
+}
+
+// technologyPageSize is the number of technologies fetched per query when
+// preloading the catalogue
+const technologyPageSize = 500
+
+// preloadTechnologies fills the lookup cache with every technology by name. The
+// catalogue is small and rarely changes, so a few paged queries replace one
+// lookup per distinct technology name; aliases are still resolved on demand.
+func preloadTechnologies(ctx context.Context, repos *repositories, log *logrus.Logger) error {
+	afterName := ""
+	for {
+		page, err := repos.tech.List(ctx, afterName, technologyPageSize)
+		if err != nil {
+			log.Errorf("Failed to load technologies: %v", err)
+			return err
+		}
+		for _, tech := range page {
+			repos.cache.technologies[tech.Name] = tech
+		}
+		if len(page) < technologyPageSize {
+			break
+		}
+		afterName = page[len(page)-1].Name
+	}
+
+	log.Infof("Loaded %d technologies", len(repos.cache.technologies))
+	return nil
 }
 
 // readJobData reads and parses the job data from the input file
@@ -162,95 +210,172 @@ func processJobs(ctx context.Context, jobData *internalJobs, repos *repositories
 	// Create a map to track missing technologies
 	missingTechnologies := make(map[string][]string) // company -> list of missing tech names
 
-	// Process each job
+	// Store every job up front, so their IDs are known before technologies are linked
+	jobModels := storeJobs(ctx, jobData, repos, log)
+
+	// Resolve the technologies of each job, collecting the associations of all jobs
+	var jobTechs []*jobtech.JobTechnology
 	for i := range jobData.Jobs {
 		j := &jobData.Jobs[i] // Use a pointer to the job instead of copying it
-
-		// Process job and its technologies
-		jobMissingTechs, err := processJob(ctx, j, repos, log)
-		if err != nil {
-			// Log error but continue with next job
-			log.Warnf("Error processing job %s: %v", j.Title, err)
-			continue
+		jobModel := jobModels[i]
+		if jobModel == nil {
+			continue // The job could not be stored, already logged
 		}
 
+		found, jobMissingTechs := processTechnologies(ctx, j, jobModel, repos, log)
+		jobTechs = append(jobTechs, found...)
+
 		// Add any missing technologies to the map
 		if len(jobMissingTechs) > 0 {
 			missingTechnologies[j.Company] = append(missingTechnologies[j.Company], jobMissingTechs...)
 		}
 	}
 
+	// Create the job technology associations of every job in a few statements
+	createJobTechnologies(ctx, jobTechs, repos.jobtech, log)
+
 	return missingTechnologies, nil
 }
 
-// Update the processJob function signature
-func processJob(ctx context.Context, j *jobData, repos *repositories, log *logrus.Logger) ([]string, error) {
-	// Find company by name
-	jobCompany, err := repos.company.GetByName(ctx, j.Company)
+// storeJobs inserts new jobs and loads the IDs of existing ones, returning the
+// job model for each input job, or nil for jobs that could not be stored. New
+// jobs are inserted in multi-row statements and existing ones are looked up by
+// signature in one query, instead of a round trip per job.
+func storeJobs(ctx context.Context, jobData *internalJobs, repos *repositories, log *logrus.Logger) []*jobs.Job {
+	jobModels := make([]*jobs.Job, len(jobData.Jobs))
+	batch := make([]*jobs.Job, 0, len(jobData.Jobs))
+	for i := range jobData.Jobs {
+		j := &jobData.Jobs[i]
+
+		companyID, err := findCompanyID(ctx, j.Company, repos, log)
+		if err != nil {
+			log.Warnf("Error processing job %s: %v", j.Title, err)
+			continue
+		}
+
+		jobModels[i] = &jobs.Job{
+			CompanyID:       companyID,
+			Title:           j.Title,
+			Description:     j.Description,
+			ExperienceLevel: j.ExperienceLevel,
+			EmploymentType:  j.EmploymentType,
+			Location:        j.Location,
+			WorkMode:        j.WorkMode,
+			ApplicationURL:  j.ApplicationURL,
+			IsActive:        true,
+			Signature:       j.Signature,
+		}
+		batch = append(batch, jobModels[i])
+	}
+
+	// Insert the new jobs; jobs whose signature already exists keep a zero ID
+	inserted, err := repos.job.CreateBatch(ctx, batch)
 	if err != nil {
-		log.Warnf("Error finding company %s: %v", j.Company, err)
-		return nil, err
+		log.Warnf("Failed to insert jobs in batches, storing them one by one: %v", err)
+		return storeJobsOneByOne(ctx, jobData, jobModels, repos.job, log)
 	}
+	log.Infof("Inserted %d new jobs", inserted)
 
-	companyID := jobCompany.ID
+	// Load the IDs of the jobs that already existed
+	var existing []string
+	for _, jobModel := range batch {
+		if jobModel.ID == 0 {
+			existing = append(existing, jobModel.Signature)
+		}
+	}
+	existingJobs, err := repos.job.GetBySignatures(ctx, existing)
+	if err != nil {
+		log.Warnf("Failed to load existing jobs, storing them one by one: %v", err)
+		return storeJobsOneByOne(ctx, jobData, jobModels, repos.job, log)
+	}
 
-	// Create job model
-	jobModel := &jobs.Job{
-		CompanyID:       companyID,
-		Title:           j.Title,
-		Description:     j.Description,
-		ExperienceLevel: j.ExperienceLevel,
-		EmploymentType:  j.EmploymentType,
-		Location:        j.Location,
-		WorkMode:        j.WorkMode,
-		ApplicationURL:  j.ApplicationURL,
-		IsActive:        true,
-		Signature:       j.Signature,
+	for i, jobModel := range jobModels {
+		if jobModel == nil {
+			continue
+		}
+		j := &jobData.Jobs[i]
+
+		if jobModel.ID == 0 {
+			existingJob, ok := existingJobs[jobModel.Signature]
+			if !ok {
+				log.Warnf("Failed to insert job %s: no job stored with signature %s", j.Title, jobModel.Signature)
+				jobModels[i] = nil
+				continue
+			}
+			// Use the existing job's ID for technology associations
+			jobModel.ID = existingJob.ID
+			jobModel.CreatedAt = existingJob.CreatedAt
+			jobModel.UpdatedAt = existingJob.UpdatedAt
+			log.Infof("Job already exists: %s at %s, using existing job ID: %d", j.Title, j.Company, jobModel.ID)
+			continue
+		}
+
+		log.Infof("Successfully added job: %s at %s (ID: %d)", jobModel.Title, j.Company, jobModel.ID)
 	}
-	fmt.Print("Processing job: ", jobModel.Title, " at ", j.Company, "\n")
 
-	// Insert or retrieve job
-	if err := createOrRetrieveJob(ctx, jobModel, j, repos.job, log); err != nil {
-		return nil, err
+	return jobModels
+}
+
+// storeJobsOneByOne creates or retrieves each job with its own statement. It is
+// the fallback when a batch fails, so one bad job does not drop the whole run.
+func storeJobsOneByOne(ctx context.Context, jobData *internalJobs, jobModels []*jobs.Job, jobRepo *jobs.Repository,
+	log *logrus.Logger) []*jobs.Job {
+	for i, jobModel := range jobModels {
+		if jobModel == nil {
+			continue
+		}
+		j := &jobData.Jobs[i]
+
+		if err := createOrRetrieveJob(ctx, jobModel, j, jobRepo, log); err != nil {
+			jobModels[i] = nil
+			continue
+		}
+
+		log.Infof("Successfully added job: %s at %s (ID: %d)", jobModel.Title, j.Company, jobModel.ID)
 	}
 
-	log.Infof("Successfully added job: %s at %s (ID: %d)",
-		jobModel.Title, j.Company, jobModel.ID)
+	return jobModels
+}
+
+// findCompanyID looks up the ID of a company by name
+func findCompanyID(ctx context.Context, companyName string, repos *repositories, log *logrus.Logger) (int, error) {
+	if companyID, ok := repos.cache.companyIDs[companyName]; ok {
+		return companyID, nil
+	}
 
-	// Process technologies for this job
-	return processTechnologies(ctx, j, jobModel, repos, log)
+	jobCompany, err := repos.company.GetByName(ctx, companyName)
+	if err != nil {
+		log.Warnf("Error finding company %s: %v", companyName, err)
+		return 0, err
+	}
+	repos.cache.companyIDs[companyName] = jobCompany.ID
+	return jobCompany.ID, nil
 }
 
-// createOrRetrieveJob creates a new job or retrieves an existing one
+// createOrRetrieveJob creates a new job or retrieves the ID of an existing one
 func createOrRetrieveJob(ctx context.Context, jobModel *jobs.Job, j *jobData, jobRepo *jobs.Repository,
 	log *logrus.Logger) error {
-	err := jobRepo.Create(ctx, jobModel)
+	created, err := jobRepo.CreateOrGet(ctx, jobModel)
 	if err != nil {
-		if jobs.IsDuplicate(err) {
-			log.Infof("Job already exists: %s at %s", j.Title, j.Company)
-
-			// Get the existing job by signature to retrieve its ID
-			existingJob, findErr := jobRepo.GetBySignature(ctx, j.Signature)
-			if findErr != nil {
-				log.Warnf("Failed to retrieve existing job %s: %v", j.Title, findErr)
-				return findErr
-			}
-
-			// Use the existing job's ID for technology associations
-			jobModel.ID = existingJob.ID
-			log.Infof("Using existing job ID: %d", jobModel.ID)
-			return nil
-		}
 		log.Warnf("Failed to insert job %s: %v", j.Title, err)
 		return err
 	}
+
+	if !created {
+		// Use the existing job's ID for technology associations
+		log.Infof("Job already exists: %s at %s, using existing job ID: %d", j.Title, j.Company, jobModel.ID)
+	}
 	return nil
 }
 
-// processTechnologies processes all technologies for a job
+// processTechnologies resolves all technologies for a job, returning the job
+// technology associations to create and the names of missing technologies
 func processTechnologies(ctx context.Context, j *jobData, jobModel *jobs.Job, repos *repositories,
-	log *logrus.Logger) ([]string, error) {
+	log *logrus.Logger) ([]*jobtech.JobTechnology, []string) {
 	var missingTechs []string
+	jobTechs := make([]*jobtech.JobTechnology, 0, len(j.Technologies))
+
+	resolveAliases(ctx, j, repos, log)
 
 	for _, tech := range j.Technologies {
 		techName := strings.ToLower(tech.Name)
@@ -262,22 +387,61 @@ func processTechnologies(ctx context.Context, j *jobData, jobModel *jobs.Job, re
 			continue
 		}
 
-		// Create job technology association
-		if err := createJobTechnology(ctx, jobModel.ID, techModel.ID,
-			tech.Required, techName, repos.jobtech, log); err != nil {
-			continue
+		jobTechs = append(jobTechs, &jobtech.JobTechnology{
+			JobID:        jobModel.ID,
+			TechnologyID: techModel.ID,
+			IsRequired:   tech.Required,
+		})
+	}
+
+	return jobTechs, missingTechs
+}
+
+// resolveAliases looks up every technology name of a job that is not cached yet
+// as an alias in one query. The catalogue is preloaded by name, so a name that is
+// neither cached nor an alias is unknown and cached as such.
+func resolveAliases(ctx context.Context, j *jobData, repos *repositories, log *logrus.Logger) {
+	var pending []string
+	for _, tech := range j.Technologies {
+		techName := strings.ToLower(tech.Name)
+		if _, ok := repos.cache.technologies[techName]; !ok && !slices.Contains(pending, techName) {
+			pending = append(pending, techName)
 		}
 	}
+	if len(pending) == 0 {
+		return
+	}
+
+	resolved, err := repos.tech.GetByAliases(ctx, pending)
+	if err != nil {
+		// Leave the names uncached so findTechnology resolves them one by one
+		log.Warnf("Failed to resolve technology aliases: %v", err)
+		return
+	}
 
-	return missingTechs, nil
+	for _, techName := range pending {
+		techModel := resolved[techName]
+		if techModel != nil {
+			log.Infof("Found technology %s via alias %s", techModel.Name, techName)
+		}
+		repos.cache.technologies[techName] = techModel
+	}
 }
 
 // findTechnology tries to find a technology by name or alias
 func findTechnology(ctx context.Context, techName string, repos *repositories,
 	log *logrus.Logger) (*technology.Technology, error) {
+	if techModel, ok := repos.cache.technologies[techName]; ok {
+		if techModel == nil {
+			return nil, &technology.NotFoundError{Name: techName}
+		}
+		return techModel, nil
+	}
+
 	// Find technology by name
 	techModel, err := repos.tech.GetByName(ctx, techName)
 	if err == nil {
+		repos.cache.technologies[techName] = techModel
 		return techModel, nil
 	}
 
@@ -285,6 +449,9 @@ func findTechnology(ctx context.Context, techName string, repos *repositories,
 	alias, aliasErr := repos.alias.GetByAlias(ctx, techName)
 	if aliasErr != nil {
 		log.Warnf("Technology not found by name or alias: %s: %v", techName, err)
+		if techalias.IsNotFound(aliasErr) {
+			repos.cache.technologies[techName] = nil
+		}
 		return nil, aliasErr
 	}
 
@@ -296,31 +463,49 @@ func findTechnology(ctx context.Context, techName string, repos *repositories,
 	}
 
 	log.Infof("Found technology %s via alias %s", techModel.Name, techName)
+	repos.cache.technologies[techName] = techModel
 	return techModel, nil
 }
 
-// createJobTechnology creates a job-technology association
-func createJobTechnology(ctx context.Context, jobID, techID int, isRequired bool, techName string,
-	jobtechRepo *jobtech.Repository, log *logrus.Logger) error {
-	jobTechModel := &jobtech.JobTechnology{
-		JobID:        jobID,
-		TechnologyID: techID,
-		IsRequired:   isRequired,
+// createJobTechnologies creates the job-technology associations for all jobs
+func createJobTechnologies(ctx context.Context, jobTechs []*jobtech.JobTechnology,
+	jobtechRepo *jobtech.Repository, log *logrus.Logger) {
+	// Insert job technologies into database, refreshing the required flag of existing ones
+	if err := jobtechRepo.UpsertBatch(ctx, jobTechs); err != nil {
+		log.Warnf("Failed to upsert job technologies in batches, upserting them job by job: %v", err)
+		createJobTechnologiesByJob(ctx, jobTechs, jobtechRepo, log)
 	}
 
-	// Insert job technology into database
-	err := jobtechRepo.Create(ctx, jobTechModel)
-	if err != nil {
-		if jobtech.IsDuplicate(err) {
-			log.Debugf("Job technology association already exists: %s for job ID %d", techName, jobID)
-			return nil
+	// Count the associations actually stored; repeated pairs share one row
+	stored := make(map[int]struct{}, len(jobTechs))
+	for _, jobTech := range jobTechs {
+		if jobTech.ID != 0 {
+			stored[jobTech.ID] = struct{}{}
 		}
-		log.Warnf("Failed to insert job technology %s: %v", techName, err)
-		return err
 	}
 
-	log.Infof("Added technology %s to job ID %d", techName, jobID)
-	return nil
+	log.Infof("Added %d job technologies", len(stored))
+}
+
+// createJobTechnologiesByJob upserts the associations of each job with its own
+// statement. It is the fallback when a batch fails, so one bad row only loses the
+// associations of its job.
+func createJobTechnologiesByJob(ctx context.Context, jobTechs []*jobtech.JobTechnology,
+	jobtechRepo *jobtech.Repository, log *logrus.Logger) {
+	var jobIDs []int
+	byJob := make(map[int][]*jobtech.JobTechnology)
+	for _, jobTech := range jobTechs {
+		if _, ok := byJob[jobTech.JobID]; !ok {
+			jobIDs = append(jobIDs, jobTech.JobID)
+		}
+		byJob[jobTech.JobID] = append(byJob[jobTech.JobID], jobTech)
+	}
+
+	for _, jobID := range jobIDs {
+		if err := jobtechRepo.UpsertBatch(ctx, byJob[jobID]); err != nil {
+			log.Warnf("Failed to upsert technologies for job ID %d: %v", jobID, err)
+		}
+	}
 }
 
 // writeMissingTechnologies writes missing technologies to a file
@@ -72,13 +72,14 @@ func run(ctx context.Context) error {
 // processTechnologies handles the two-pass technology import process
 func processTechnologies(ctx context.Context, log *logrus.Logger, techRepo *technology.Repository,
 	aliasRepo *techalias.Repository) {
-	// Create a map to store all technologies by name for lookup
-	techMap := make(map[string]*technology.Technology)
-
 	// Process and insert all technologies
 	technologies := readTechnologiesFromJSON()
 	log.Infof("Loaded %d technologies from JSON file", len(technologies))
 
+	// Create a map to store all technologies by name for lookup, so parents are
+	// resolved in a single linear pass
+	techMap := make(map[string]*technology.Technology, len(technologies))
+
 	// First pass: create technologies without parent references
 	log.Info("Starting first pass: creating technologies without parent references")
 	createTechnologies(ctx, log, techRepo, aliasRepo, technologies, techMap)
@@ -88,52 +89,53 @@ func processTechnologies(ctx context.Context, log *logrus.Logger, techRepo *tech
 	updateTechnologyParents(ctx, log, techRepo, technologies, techMap)
 }
 
-// createTechnologies handles the first pass of creating technologies
+// createTechnologies handles the first pass of creating technologies. Every
+// technology is upserted by name in a few multi-row statements, so existing ones
+// keep their ID and pick up category changes without a lookup per name.
 func createTechnologies(ctx context.Context, log *logrus.Logger, techRepo *technology.Repository,
 	aliasRepo *techalias.Repository, technologies []Technology, techMap map[string]*technology.Technology) {
 
-	for _, tech := range technologies {
-		// Convert name to lowercase
-		techName := strings.ToLower(tech.Name)
-
-		// Create the technology model
-		newTech := &technology.Technology{
-			Name:     techName,
+	newTechs := make([]*technology.Technology, len(technologies))
+	for i, tech := range technologies {
+		newTechs[i] = &technology.Technology{
+			// Convert name to lowercase
+			Name:     strings.ToLower(tech.Name),
 			Category: tech.Category,
 			// Parent ID will be set in the second pass
 		}
+	}
 
-		var existingTech *technology.Technology
+	// Insert into database, updating the category of existing technologies
+	if err := techRepo.UpsertBatch(ctx, newTechs); err != nil {
+		log.Warnf("Failed to upsert technologies in batches, upserting them one by one: %v", err)
+		createTechnologiesOneByOne(ctx, log, techRepo, newTechs)
+	}
 
-		// Insert into database
-		err := techRepo.Create(ctx, newTech)
-		if err != nil {
-			// Skip if it's a duplicate
-			if technology.IsDuplicate(err) {
-				log.Infof("Technology already exists: %s", techName)
-
-				// Fetch the existing technology to use for parent mapping
-				existingTech, err = techRepo.GetByName(ctx, techName)
-				if err != nil {
-					log.Warnf("Error fetching existing technology %s: %v", techName, err)
-					continue
-				}
-				techMap[techName] = existingTech
-
-				// Add aliases for existing technology
-				addAliases(ctx, log, aliasRepo, existingTech.ID, tech.Alias)
-				continue
-			}
-			log.Warnf("Error creating technology %s: %v", techName, err)
-			continue
+	// Count the technologies actually stored; repeated names share one row
+	stored := make(map[int]struct{}, len(newTechs))
+	for i, tech := range technologies {
+		newTech := newTechs[i]
+		if newTech.ID == 0 {
+			continue // Not stored, so it has no ID to attach aliases or children to
 		}
+		stored[newTech.ID] = struct{}{}
+		techMap[newTech.Name] = newTech
 
-		log.Infof("Created technology: %s (ID: %d)", techName, newTech.ID)
-		techMap[techName] = newTech
-
-		// Add aliases for new technology
+		// Add aliases for the technology
 		addAliases(ctx, log, aliasRepo, newTech.ID, tech.Alias)
 	}
+	log.Infof("Upserted %d technologies", len(stored))
+}
+
+// createTechnologiesOneByOne upserts each technology with its own statement. It is
+// the fallback when a batch fails, so one bad row only loses that technology.
+func createTechnologiesOneByOne(ctx context.Context, log *logrus.Logger, techRepo *technology.Repository,
+	newTechs []*technology.Technology) {
+	for _, newTech := range newTechs {
+		if err := techRepo.UpsertBatch(ctx, []*technology.Technology{newTech}); err != nil {
+			log.Warnf("Error upserting technology %s: %v", newTech.Name, err)
+		}
+	}
 }
 
 // updateTechnologyParents handles the second pass of updating parent references
@@ -162,12 +164,12 @@ func updateTechnologyParents(ctx context.Context, log *logrus.Logger, techRepo *
 		}
 
 		// Update the parent ID
-		currentTech.ParentID = &parentTech.ID
-		err := techRepo.Update(ctx, currentTech)
+		err := techRepo.UpdateParent(ctx, currentTech.ID, &parentTech.ID)
 		if err != nil {
 			log.Warnf("Error updating parent for %s: %v", currentTech.Name, err)
 			continue
 		}
+		currentTech.ParentID = &parentTech.ID
 
 		log.Infof("Updated technology %s with parent %s (ID: %d)",
 			currentTech.Name, parentTech.Name, parentTech.ID)
@@ -35,7 +35,7 @@ const docTemplate = `{
                     {
                         "type": "string",
                         "example": "\"golang developer\"",
-                        "description": "Search query",
+                        "description": "Search query (supports quoted phrases, OR and -term exclusions)",
                         "name": "q",
                         "in": "query",
                         "required": true
@@ -52,10 +52,16 @@ const docTemplate = `{
                         "type": "integer",
                         "default": 0,
                         "example": 0,
-                        "description": "Number of results to skip",
+                        "description": "Number of results to skip (max 1000, use cursor for deeper pages)",
                         "name": "offset",
                         "in": "query"
                     },
+                    {
+                        "type": "string",
+                        "description": "Cursor from pagination.next_cursor to fetch the next page",
+                        "name": "cursor",
+                        "in": "query"
+                    },
                     {
                         "type": "string",
                         "description": "Experience level filter",
@@ -111,6 +117,16 @@ const docTemplate = `{
                         "description": "End date filter (YYYY-MM-DD)",
                         "name": "date_to",
                         "in": "query"
+                    },
+                    {
+                        "type": "array",
+                        "items": {
+                            "type": "string"
+                        },
+                        "collectionFormat": "multi",
+                        "description": "Technology filter, repeat to require several (max 5)",
+                        "name": "technology",
+                        "in": "query"
                     }
                 ],
                 "responses": {
@@ -218,6 +234,9 @@ const docTemplate = `{
                 "limit": {
                     "type": "integer"
                 },
+                "next_cursor": {
+                    "type": "string"
+                },
                 "offset": {
                     "type": "integer"
                 },
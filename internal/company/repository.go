@@ -8,6 +8,7 @@ import (
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgconn"
 
+	"github.com/rodruizronald/ticos-in-tech/internal/database"
 	"github.com/rodruizronald/ticos-in-tech/internal/jobs"
 )
 
@@ -78,8 +79,7 @@ func (r *Repository) Create(ctx context.Context, company *Company) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate company name)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Name: company.Name}
 		}
 		return fmt.Errorf("failed to create company: %w", err)
@@ -127,8 +127,7 @@ func (r *Repository) Update(ctx context.Context, company *Company) error {
 		}
 
 		// Check for unique constraint violation (duplicate company name)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Name: company.Name}
 		}
 
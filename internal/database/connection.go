@@ -6,9 +6,16 @@ import (
 	"fmt"
 	"time"
 
+	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgxpool"
 )
 
+// StatementCacheCapacity is the number of prepared statements cached per connection.
+// Repository queries are fixed SQL constants, but the job search produces one
+// statement per combination of filters, so the capacity leaves room for those
+// variants without evicting the hot constant queries.
+const StatementCacheCapacity = 1024
+
 // Config holds the configuration for the database connection.
 type Config struct {
 	Host     string
@@ -50,9 +57,16 @@ func Connect(ctx context.Context, config *Config) (*pgxpool.Pool, error) {
 
 	// Set connection pool settings
 	poolConfig.MaxConns = 10
+	// Keep a couple of connections open through idle periods, so the first requests
+	// afterwards don't pay for a new connection and its empty statement cache
+	poolConfig.MinConns = 2
 	poolConfig.MaxConnLifetime = 1 * time.Hour
 	poolConfig.MaxConnIdleTime = 30 * time.Minute
 
+	// Prepare each distinct statement once per connection and reuse its plan
+	poolConfig.ConnConfig.DefaultQueryExecMode = pgx.QueryExecModeCacheStatement
+	poolConfig.ConnConfig.StatementCacheCapacity = StatementCacheCapacity
+
 	// Connect to the database
 	pool, err := pgxpool.NewWithConfig(ctx, poolConfig)
 	if err != nil {
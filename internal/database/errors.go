@@ -0,0 +1,16 @@
+package database
+
+import (
+	"errors"
+
+	"github.com/jackc/pgx/v5/pgconn"
+)
+
+// UniqueViolationCode is the PostgreSQL error code for unique constraint violations.
+const UniqueViolationCode = "23505"
+
+// IsUniqueViolation checks if an error is a PostgreSQL unique constraint violation.
+func IsUniqueViolation(err error) bool {
+	var pgErr *pgconn.PgError
+	return errors.As(err, &pgErr) && pgErr.Code == UniqueViolationCode
+}
@@ -0,0 +1,53 @@
+package database
+
+import (
+	"errors"
+	"fmt"
+	"testing"
+
+	"github.com/jackc/pgx/v5/pgconn"
+	"github.com/stretchr/testify/assert"
+)
+
+func TestIsUniqueViolation(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name     string
+		err      error
+		expected bool
+	}{
+		{
+			name:     "unique violation",
+			err:      &pgconn.PgError{Code: UniqueViolationCode},
+			expected: true,
+		},
+		{
+			name:     "wrapped unique violation",
+			err:      fmt.Errorf("failed to create: %w", &pgconn.PgError{Code: UniqueViolationCode}),
+			expected: true,
+		},
+		{
+			name:     "other postgres error",
+			err:      &pgconn.PgError{Code: "23503"},
+			expected: false,
+		},
+		{
+			name:     "non postgres error",
+			err:      errors.New("database error"),
+			expected: false,
+		},
+		{
+			name:     "nil error",
+			err:      nil,
+			expected: false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			assert.Equal(t, tt.expected, IsUniqueViolation(tt.err))
+		})
+	}
+}
@@ -0,0 +1,114 @@
+package httpservice
+
+import (
+	"container/list"
+	"context"
+	"sync"
+	"time"
+)
+
+// CacheableSearchParams represents search parameters that can identify a cached result
+type CacheableSearchParams interface {
+	SearchParams
+	CacheKey() string
+}
+
+// cacheEntry holds a cached search result until it expires
+type cacheEntry[TResult SearchResult] struct {
+	key       string
+	result    TResult
+	total     int
+	expiresAt time.Time
+}
+
+// CachedSearchService - GENERIC IMPLEMENTATION that caches results of a wrapped SearchService
+// for a fixed TTL, so repeated searches and page counts skip the database. Once maxEntries
+// results are cached, the least recently used one is evicted to make room.
+type CachedSearchService[TParams CacheableSearchParams, TResult SearchResult] struct {
+	service    SearchService[TParams, TResult]
+	ttl        time.Duration
+	maxEntries int
+	now        func() time.Time
+
+	mu      sync.Mutex
+	entries map[string]*list.Element // Values are *cacheEntry[TResult]
+	lru     *list.List               // Most recently used entry first
+}
+
+// NewCachedSearchService - CONVENIENCE CONSTRUCTOR wrapping a SearchService with a TTL cache
+func NewCachedSearchService[TParams CacheableSearchParams, TResult SearchResult](
+	service SearchService[TParams, TResult], ttl time.Duration, maxEntries int,
+) *CachedSearchService[TParams, TResult] {
+	return &CachedSearchService[TParams, TResult]{
+		service:    service,
+		ttl:        ttl,
+		maxEntries: maxEntries,
+		now:        time.Now,
+		entries:    make(map[string]*list.Element),
+		lru:        list.New(),
+	}
+}
+
+// ExecuteSearch returns a cached result when one is still fresh, otherwise it delegates
+// to the wrapped service and caches the successful result.
+func (s *CachedSearchService[TParams, TResult]) ExecuteSearch(ctx context.Context, params TParams) (TResult, int, error) {
+	key := params.CacheKey()
+	if key == "" {
+		return s.service.ExecuteSearch(ctx, params)
+	}
+
+	now := s.now()
+	if entry, ok := s.lookup(key, now); ok {
+		return entry.result, entry.total, nil
+	}
+
+	result, total, err := s.service.ExecuteSearch(ctx, params)
+	if err != nil {
+		var zero TResult
+		return zero, 0, err
+	}
+
+	s.store(&cacheEntry[TResult]{key: key, result: result, total: total, expiresAt: now.Add(s.ttl)})
+
+	return result, total, nil
+}
+
+// lookup returns the fresh entry cached under key and marks it as recently used.
+// An expired entry is removed.
+func (s *CachedSearchService[TParams, TResult]) lookup(key string, now time.Time) (*cacheEntry[TResult], bool) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	element, ok := s.entries[key]
+	if !ok {
+		return nil, false
+	}
+	entry := element.Value.(*cacheEntry[TResult])
+	if !now.Before(entry.expiresAt) {
+		s.lru.Remove(element)
+		delete(s.entries, key)
+		return nil, false
+	}
+	s.lru.MoveToFront(element)
+	return entry, true
+}
+
+// store caches entry, evicting the least recently used entries while the cache is full
+func (s *CachedSearchService[TParams, TResult]) store(entry *cacheEntry[TResult]) {
+	s.mu.Lock()
+	defer s.mu.Unlock()
+
+	// A concurrent search for the same key may have stored it already
+	if element, ok := s.entries[entry.key]; ok {
+		element.Value = entry
+		s.lru.MoveToFront(element)
+		return
+	}
+
+	for s.lru.Len() > 0 && s.lru.Len() >= s.maxEntries {
+		oldest := s.lru.Back()
+		s.lru.Remove(oldest)
+		delete(s.entries, oldest.Value.(*cacheEntry[TResult]).key)
+	}
+	s.entries[entry.key] = s.lru.PushFront(entry)
+}
@@ -0,0 +1,156 @@
+package httpservice
+
+import (
+	"context"
+	"errors"
+	"fmt"
+	"testing"
+	"time"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+type testParams struct {
+	key string
+}
+
+func (p *testParams) GetLimit() int    { return 10 }
+func (p *testParams) GetOffset() int   { return 0 }
+func (p *testParams) CacheKey() string { return p.key }
+
+type testResult []string
+
+func (r testResult) GetItems() []any {
+	items := make([]any, len(r))
+	for i, item := range r {
+		items[i] = item
+	}
+	return items
+}
+
+func (r testResult) GetTotal() int { return len(r) }
+
+type countingService struct {
+	calls int
+	err   error
+}
+
+func (s *countingService) ExecuteSearch(_ context.Context, params *testParams) (testResult, int, error) {
+	s.calls++
+	if s.err != nil {
+		return nil, 0, s.err
+	}
+	return testResult{params.key}, 42, nil
+}
+
+func TestCachedSearchService_ExecuteSearch(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name  string
+		check func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+			now *time.Time)
+	}{
+		{
+			name: "repeated search is served from cache",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				_ *time.Time) {
+				t.Helper()
+				for range 3 {
+					result, total, err := cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+					require.NoError(t, err)
+					assert.Equal(t, testResult{"golang"}, result)
+					assert.Equal(t, 42, total)
+				}
+				assert.Equal(t, 1, inner.calls)
+			},
+		},
+		{
+			name: "different keys are cached separately",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				_ *time.Time) {
+				t.Helper()
+				_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+				require.NoError(t, err)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "python"})
+				require.NoError(t, err)
+				assert.Equal(t, 2, inner.calls)
+			},
+		},
+		{
+			name: "expired entry is refreshed",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				now *time.Time) {
+				t.Helper()
+				_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+				require.NoError(t, err)
+				*now = now.Add(2 * time.Minute)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+				require.NoError(t, err)
+				assert.Equal(t, 2, inner.calls)
+			},
+		},
+		{
+			name: "full cache evicts the least recently used entry",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				_ *time.Time) {
+				t.Helper()
+				for i := range 10 {
+					_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: fmt.Sprintf("key%d", i)})
+					require.NoError(t, err)
+				}
+				// Use key0 again so key1 becomes the least recently used entry
+				_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: "key0"})
+				require.NoError(t, err)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "key10"})
+				require.NoError(t, err)
+				assert.Equal(t, 11, inner.calls)
+
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "key0"})
+				require.NoError(t, err)
+				assert.Equal(t, 11, inner.calls)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "key1"})
+				require.NoError(t, err)
+				assert.Equal(t, 12, inner.calls)
+			},
+		},
+		{
+			name: "errors are not cached",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				_ *time.Time) {
+				t.Helper()
+				inner.err = errors.New("database error")
+				_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+				require.Error(t, err)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: "golang"})
+				require.Error(t, err)
+				assert.Equal(t, 2, inner.calls)
+			},
+		},
+		{
+			name: "empty key bypasses cache",
+			check: func(t *testing.T, cached *CachedSearchService[*testParams, testResult], inner *countingService,
+				_ *time.Time) {
+				t.Helper()
+				_, _, err := cached.ExecuteSearch(context.Background(), &testParams{key: ""})
+				require.NoError(t, err)
+				_, _, err = cached.ExecuteSearch(context.Background(), &testParams{key: ""})
+				require.NoError(t, err)
+				assert.Equal(t, 2, inner.calls)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			inner := &countingService{}
+			now := time.Now()
+			cached := NewCachedSearchService[*testParams, testResult](inner, time.Minute, 10)
+			cached.now = func() time.Time { return now }
+
+			tt.check(t, cached, inner, &now)
+		})
+	}
+}
@@ -50,16 +50,31 @@ func NewDefaultResponseBuilder[TResult SearchResult, TParams SearchParams]() Res
 // BuildSearchResponse - GENERIC IMPLEMENTATION that consumers can use
 func (b *DefaultResponseBuilder[TResult, TParams]) BuildSearchResponse(results TResult, total int,
 	params TParams) SearchResponse {
-	hasMore := params.GetOffset()+len(results.GetItems()) < total
+	// GetItems converts the page to []any on every call, so convert it once
+	items := results.GetItems()
+
+	// Pages requested by cursor start at an offset only the results know
+	offset := params.GetOffset()
+	if offsetResult, ok := any(results).(OffsetResult); ok && len(items) > 0 {
+		offset = offsetResult.GetOffset()
+	}
+	hasMore := offset+len(items) < total
+
+	pagination := PaginationDetails{
+		Total:   total,
+		Limit:   params.GetLimit(),
+		Offset:  offset,
+		HasMore: hasMore,
+	}
+
+	// Results supporting keyset pagination hand out a cursor for the next page
+	if cursorResult, ok := any(results).(CursorResult); ok && hasMore {
+		pagination.NextCursor = cursorResult.GetNextCursor()
+	}
 
 	return SearchResponse{
-		Data: results.GetItems(),
-		Pagination: PaginationDetails{
-			Total:   total,
-			Limit:   params.GetLimit(),
-			Offset:  params.GetOffset(),
-			HasMore: hasMore,
-		},
+		Data:       items,
+		Pagination: pagination,
 	}
 }
 
@@ -1,7 +1,9 @@
 package httpservice
 
 import (
+	"fmt"
 	"net/http"
+	"net/url"
 
 	"github.com/gin-gonic/gin"
 )
@@ -73,5 +75,21 @@ func (h *SearchHandler[TRequest, TParams, TResult]) HandleSearch(c *gin.Context)
 
 	// Build and send response using generic builder
 	response := h.responseBuilder.BuildSearchResponse(results, total, searchParams.(TParams))
+
+	// Advertise the next page so clients can follow it without building URLs
+	if response.Pagination.NextCursor != "" {
+		c.Header("Link", nextPageLink(c.Request.URL, response.Pagination.NextCursor))
+	}
 	c.JSON(http.StatusOK, response)
 }
+
+// nextPageLink builds an RFC 8288 Link header value pointing at the page after
+// the current one: the same request with the cursor replaced and any offset dropped.
+func nextPageLink(current *url.URL, cursor string) string {
+	query := current.Query()
+	query.Set("cursor", cursor)
+	query.Del("offset")
+
+	next := url.URL{Path: current.Path, RawQuery: query.Encode()}
+	return fmt.Sprintf("<%s>; rel=\"next\"", next.String())
+}
@@ -0,0 +1,49 @@
+package httpservice
+
+import (
+	"net/url"
+	"testing"
+
+	"github.com/stretchr/testify/assert"
+	"github.com/stretchr/testify/require"
+)
+
+func TestNextPageLink(t *testing.T) {
+	t.Parallel()
+
+	tests := []struct {
+		name     string
+		current  string
+		cursor   string
+		expected string
+	}{
+		{
+			name:     "first page",
+			current:  "/api/v1/jobs?q=golang&limit=20",
+			cursor:   "abc",
+			expected: `</api/v1/jobs?cursor=abc&limit=20&q=golang>; rel="next"`,
+		},
+		{
+			name:     "replaces cursor",
+			current:  "/api/v1/jobs?q=golang&cursor=old",
+			cursor:   "new",
+			expected: `</api/v1/jobs?cursor=new&q=golang>; rel="next"`,
+		},
+		{
+			name:     "drops offset",
+			current:  "/api/v1/jobs?q=golang&offset=40",
+			cursor:   "abc",
+			expected: `</api/v1/jobs?cursor=abc&q=golang>; rel="next"`,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			current, err := url.Parse(tt.current)
+			require.NoError(t, err)
+
+			assert.Equal(t, tt.expected, nextPageLink(current, tt.cursor))
+		})
+	}
+}
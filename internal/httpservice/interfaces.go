@@ -24,6 +24,17 @@ type SearchResult interface {
 	GetTotal() int
 }
 
+// CursorResult is implemented by search results that support keyset pagination
+type CursorResult interface {
+	GetNextCursor() string
+}
+
+// OffsetResult is implemented by search results that know their offset in the full result set,
+// e.g. pages requested by cursor rather than by offset
+type OffsetResult interface {
+	GetOffset() int
+}
+
 // SearchService handles business logic (domain layer concern) - THIS IS WHAT CONSUMERS MUST IMPLEMENT
 type SearchService[TParams SearchParams, TResult SearchResult] interface {
 	ExecuteSearch(ctx context.Context, params TParams) (TResult, int, error)
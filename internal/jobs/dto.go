@@ -72,6 +72,8 @@ var (
 const (
 	MaxQueryLength = 100 // Maximum characters for search query
 	MinQueryLength = 2   // Minimum meaningful search length
+
+	MaxTechnologyFilters = 5 // Maximum technologies a search can filter by
 )
 
 // Data Transfer Objects (DTOs) for the job API layer.
@@ -81,16 +83,18 @@ const (
 
 // SearchRequest represents the search request parameters (API layer)
 type SearchRequest struct {
-	Query           string `form:"q" binding:"required" example:"golang developer"`
-	Limit           int    `form:"limit" example:"20"`
-	Offset          int    `form:"offset" example:"0"`
-	ExperienceLevel string `form:"experience_level" example:"Senior"`
-	EmploymentType  string `form:"employment_type" example:"Full-time"`
-	Location        string `form:"location" example:"Costa Rica"`
-	WorkMode        string `form:"work_mode" example:"Remote"`
-	Company         string `form:"company" example:"Tech Corp"`
-	DateFrom        string `form:"date_from" example:"2024-01-01"`
-	DateTo          string `form:"date_to" example:"2024-12-31"`
+	Query           string   `form:"q" binding:"required" example:"golang developer"`
+	Limit           int      `form:"limit" example:"20"`
+	Offset          int      `form:"offset" example:"0"`
+	Cursor          string   `form:"cursor"`
+	ExperienceLevel string   `form:"experience_level" example:"Senior"`
+	EmploymentType  string   `form:"employment_type" example:"Full-time"`
+	Location        string   `form:"location" example:"Costa Rica"`
+	WorkMode        string   `form:"work_mode" example:"Remote"`
+	Company         string   `form:"company" example:"Tech Corp"`
+	DateFrom        string   `form:"date_from" example:"2024-01-01"`
+	DateTo          string   `form:"date_to" example:"2024-12-31"`
+	Technologies    []string `form:"technology" example:"golang"`
 }
 
 // ToSearchParams converts a SearchRequest to SearchParams
@@ -110,6 +114,19 @@ func (req *SearchRequest) ToSearchParams() (httpservice.SearchParams, error) {
 		Offset: offset,
 	}
 
+	// Decode keyset cursor if provided
+	if req.Cursor != "" {
+		cursor, err := decodeCursor(req.Cursor)
+		if err != nil {
+			return nil, &httpservice.ConversionError{
+				Field: "cursor",
+				Value: req.Cursor,
+				Err:   err,
+			}
+		}
+		searchParams.Cursor = cursor
+	}
+
 	// Set optional filters
 	if req.ExperienceLevel != "" {
 		searchParams.ExperienceLevel = &req.ExperienceLevel
@@ -126,6 +143,9 @@ func (req *SearchRequest) ToSearchParams() (httpservice.SearchParams, error) {
 	if req.Company != "" {
 		searchParams.Company = &req.Company
 	}
+	if len(req.Technologies) > 0 {
+		searchParams.Technologies = normalizeTechnologies(req.Technologies)
+	}
 
 	// Parse dates if provided
 	if req.DateFrom != "" && req.DateTo != "" {
@@ -159,12 +179,18 @@ func (req *SearchRequest) Validate() error {
 	// Validate query
 	req.validateQuery(&errors)
 
+	// Validate pagination
+	req.validatePagination(&errors)
+
 	// Validate enum fields
 	req.validateEnumFields(&errors)
 
 	// Validate date range
 	req.validateDateRange(&errors)
 
+	// Validate technology filters
+	req.validateTechnologies(&errors)
+
 	if len(errors) > 0 {
 		return &httpservice.ValidationError{Errors: errors}
 	}
@@ -194,6 +220,17 @@ func (req *SearchRequest) validateQuery(errors *[]string) {
 	}
 }
 
+// validatePagination validates offset and cursor pagination parameters
+func (req *SearchRequest) validatePagination(errors *[]string) {
+	if req.Offset > MaxOffset {
+		*errors = append(*errors, fmt.Sprintf("offset cannot exceed %d, use cursor pagination instead", MaxOffset))
+	}
+
+	if req.Cursor != "" && req.Offset > 0 {
+		*errors = append(*errors, "cursor and offset cannot be combined")
+	}
+}
+
 // validateEnumFields validates enum field values
 func (req *SearchRequest) validateEnumFields(errors *[]string) {
 	if req.ExperienceLevel != "" && !slices.Contains(validExperienceLevels, req.ExperienceLevel) {
@@ -242,6 +279,13 @@ func (req *SearchRequest) validateDateRange(errors *[]string) {
 	}
 }
 
+// validateTechnologies validates the technology filters
+func (req *SearchRequest) validateTechnologies(errors *[]string) {
+	if len(normalizeTechnologies(req.Technologies)) > MaxTechnologyFilters {
+		*errors = append(*errors, fmt.Sprintf("cannot filter by more than %d technologies", MaxTechnologyFilters))
+	}
+}
+
 // JobResponse represents the API response for a single job
 type JobResponse struct {
 	ID              int                  `json:"job_id"`
@@ -257,6 +301,7 @@ type JobResponse struct {
 	ApplicationURL  string               `json:"application_url"`
 	Technologies    []TechnologyResponse `json:"technologies"`
 	PostedAt        time.Time            `json:"posted_at"`
+	position        int                  // Zero-based position in the search results
 }
 
 // TechnologyResponse represents the API response for job technologies
@@ -274,10 +319,11 @@ type SearchResponse struct {
 
 // PaginationDetails contains pagination metadata
 type PaginationDetails struct {
-	Total   int  `json:"total"`
-	Limit   int  `json:"limit"`
-	Offset  int  `json:"offset"`
-	HasMore bool `json:"has_more"`
+	Total      int    `json:"total"`
+	Limit      int    `json:"limit"`
+	Offset     int    `json:"offset"`
+	HasMore    bool   `json:"has_more"`
+	NextCursor string `json:"next_cursor,omitempty"`
 }
 
 // ErrorResponse represents an API error response
@@ -309,3 +355,21 @@ func (jrl JobResponseList) GetItems() []any {
 func (jrl JobResponseList) GetTotal() int {
 	return len(jrl)
 }
+
+// GetNextCursor returns the cursor positioned after the last job to satisfy httpservice.CursorResult interface
+func (jrl JobResponseList) GetNextCursor() string {
+	if len(jrl) == 0 {
+		return ""
+	}
+	last := jrl[len(jrl)-1]
+	return encodeCursor(Cursor{CreatedAt: last.PostedAt, ID: last.ID})
+}
+
+// GetOffset returns the position of the first job in the search results to satisfy httpservice.OffsetResult
+// interface, so pages requested by cursor report their offset too
+func (jrl JobResponseList) GetOffset() int {
+	if len(jrl) == 0 {
+		return 0
+	}
+	return jrl[0].position
+}
@@ -163,6 +163,52 @@ func TestSearchRequest_ToSearchParams(t *testing.T) {
 				assert.Nil(t, searchParams.DateTo)
 			},
 		},
+		{
+			name: "technology filters are normalized",
+			request: &SearchRequest{
+				Query:        "backend",
+				Technologies: []string{" Golang", "postgresql", "GOLANG", ""},
+			},
+			checkResults: func(t *testing.T, result httpservice.SearchParams, err error) {
+				t.Helper()
+				require.NoError(t, err)
+
+				searchParams := result.(*SearchParams)
+				assert.Equal(t, []string{"golang", "postgresql"}, searchParams.Technologies)
+			},
+		},
+		{
+			name: "cursor is decoded into keyset position",
+			request: &SearchRequest{
+				Query:  "backend",
+				Cursor: encodeCursor(Cursor{CreatedAt: time.Date(2024, 5, 1, 10, 0, 0, 0, time.UTC), ID: 42}),
+			},
+			checkResults: func(t *testing.T, result httpservice.SearchParams, err error) {
+				t.Helper()
+				require.NoError(t, err)
+
+				searchParams := result.(*SearchParams)
+				require.NotNil(t, searchParams.Cursor)
+				assert.Equal(t, 42, searchParams.Cursor.ID)
+				assert.Equal(t, time.Date(2024, 5, 1, 10, 0, 0, 0, time.UTC), searchParams.Cursor.CreatedAt)
+			},
+		},
+		{
+			name: "invalid cursor",
+			request: &SearchRequest{
+				Query:  "backend",
+				Cursor: "not-a-cursor",
+			},
+			checkResults: func(t *testing.T, result httpservice.SearchParams, err error) {
+				t.Helper()
+				require.Error(t, err)
+				assert.Nil(t, result)
+
+				var conversionErr *httpservice.ConversionError
+				require.ErrorAs(t, err, &conversionErr)
+				assert.Equal(t, "cursor", conversionErr.Field)
+			},
+		},
 		{
 			name: "only date_from provided - should not set dates",
 			request: &SearchRequest{
@@ -659,6 +705,63 @@ func TestSearchRequest_Validate(t *testing.T) {
 				assert.Contains(t, validationErr.Errors, "date_from must be in YYYY-MM-DD format")
 			},
 		},
+		{
+			name: "valid technology filters",
+			request: &SearchRequest{
+				Query:        "developer",
+				Technologies: []string{"golang", "docker"},
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.NoError(t, err)
+			},
+		},
+		{
+			name: "too many technology filters",
+			request: &SearchRequest{
+				Query:        "developer",
+				Technologies: []string{"golang", "docker", "kubernetes", "postgresql", "redis", "kafka"},
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.Error(t, err)
+
+				var validationErr *httpservice.ValidationError
+				require.ErrorAs(t, err, &validationErr)
+				assert.Contains(t, validationErr.Errors, "cannot filter by more than 5 technologies")
+			},
+		},
+		{
+			name: "offset exceeds maximum",
+			request: &SearchRequest{
+				Query:  "developer",
+				Offset: MaxOffset + 1,
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.Error(t, err)
+
+				var validationErr *httpservice.ValidationError
+				require.ErrorAs(t, err, &validationErr)
+				assert.Contains(t, validationErr.Errors, "offset cannot exceed 1000, use cursor pagination instead")
+			},
+		},
+		{
+			name: "cursor combined with offset",
+			request: &SearchRequest{
+				Query:  "developer",
+				Offset: 20,
+				Cursor: encodeCursor(Cursor{CreatedAt: time.Now(), ID: 1}),
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.Error(t, err)
+
+				var validationErr *httpservice.ValidationError
+				require.ErrorAs(t, err, &validationErr)
+				assert.Contains(t, validationErr.Errors, "cursor and offset cannot be combined")
+			},
+		},
 		{
 			name: "boundary case: date format without leading zeros",
 			request: &SearchRequest{
@@ -685,3 +788,42 @@ func TestSearchRequest_Validate(t *testing.T) {
 		})
 	}
 }
+
+func TestJobResponseList_GetNextCursor(t *testing.T) {
+	t.Parallel()
+
+	postedAt := time.Date(2024, 5, 1, 10, 0, 0, 0, time.UTC)
+
+	t.Run("empty list has no cursor", func(t *testing.T) {
+		t.Parallel()
+		assert.Empty(t, JobResponseList{}.GetNextCursor())
+	})
+
+	t.Run("cursor points after the last job", func(t *testing.T) {
+		t.Parallel()
+		list := JobResponseList{
+			{ID: 7, PostedAt: postedAt.Add(time.Hour)},
+			{ID: 5, PostedAt: postedAt},
+		}
+
+		cursor, err := decodeCursor(list.GetNextCursor())
+		require.NoError(t, err)
+		assert.Equal(t, 5, cursor.ID)
+		assert.Equal(t, postedAt, cursor.CreatedAt)
+	})
+}
+
+func TestJobResponseList_GetOffset(t *testing.T) {
+	t.Parallel()
+
+	t.Run("empty list starts at zero", func(t *testing.T) {
+		t.Parallel()
+		assert.Equal(t, 0, JobResponseList{}.GetOffset())
+	})
+
+	t.Run("offset is the position of the first job", func(t *testing.T) {
+		t.Parallel()
+		list := JobResponseList{{ID: 7, position: 20}, {ID: 5, position: 21}}
+		assert.Equal(t, 20, list.GetOffset())
+	})
+}
@@ -2,6 +2,7 @@ package jobs
 
 import (
 	"context"
+	"time"
 
 	"github.com/gin-gonic/gin"
 
@@ -14,6 +15,12 @@ const (
 	JobsRoute = "/jobs"
 )
 
+// Constants for search result caching
+const (
+	SearchCacheTTL        = time.Minute // Jobs are imported in batches, so short-lived results are safe to reuse
+	SearchCacheMaxEntries = 1000
+)
+
 // DataRepository interface to make database operations for the Job model.
 type DataRepository interface {
 	SearchJobsWithCount(ctx context.Context, params *SearchParams) ([]*JobWithCompany, int, error)
@@ -49,8 +56,10 @@ func NewRepositories(jobRepo *Repository, jobtechRepo *jobtech.Repository) *Repo
 
 // NewHandler creates a new job handler using httpservice.NewSearchHandlerWithDefaults
 func NewHandler(repos DataRepository) *Handler {
-	// Create the search service
-	searchService := NewSearchService(repos)
+	// Create the search service, caching results for repeated searches and pages
+	var searchService httpservice.SearchService[*SearchParams, JobResponseList] = httpservice.NewCachedSearchService(
+		NewSearchService(repos), SearchCacheTTL, SearchCacheMaxEntries,
+	)
 
 	// Create the generic search handler with defaults
 	searchHandler := httpservice.NewSearchHandlerWithDefaults(
@@ -74,9 +83,10 @@ func (h *Handler) RegisterRoutes(rg *gin.RouterGroup) {
 // @Tags jobs
 // @Accept json
 // @Produce json
-// @Param q query string true "Search query" example("golang developer")
+// @Param q query string true "Search query (supports quoted phrases, OR and -term exclusions)" example("golang developer")
 // @Param limit query int false "Number of results to return (max 100)" default(20) example(20)
-// @Param offset query int false "Number of results to skip" default(0) example(0)
+// @Param offset query int false "Number of results to skip (max 1000, use cursor for deeper pages)" default(0) example(0)
+// @Param cursor query string false "Cursor from pagination.next_cursor to fetch the next page"
 // @Param experience_level query string false "Experience level filter" \
 // Enums(Entry-level,Junior,Mid-level,Senior,Lead,Principal,Executive) example("Senior")
 // @Param employment_type query string false "Employment type filter" \
@@ -86,6 +96,7 @@ func (h *Handler) RegisterRoutes(rg *gin.RouterGroup) {
 // @Param company query string false "Company name filter (partial match)" example("Tech Corp")
 // @Param date_from query string false "Start date filter (YYYY-MM-DD)" example("2024-01-01")
 // @Param date_to query string false "End date filter (YYYY-MM-DD)" example("2024-12-31")
+// @Param technology query []string false "Technology filter, repeat to require several (max 5)" collectionFormat(multi)
 // @Success 200 {object} SearchResponse
 // @Failure 400 {object} ErrorResponse
 // @Failure 500 {object} ErrorResponse
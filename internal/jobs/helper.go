@@ -1,10 +1,22 @@
 package jobs
 
 import (
+	"encoding/base64"
+	"encoding/json"
+	"errors"
+	"fmt"
+	"slices"
 	"strings"
 	"unicode"
 )
 
+// suspiciousPatterns are SQL-like fragments rejected in search queries. Built once
+// at package init rather than on every request.
+var suspiciousPatterns = []string{
+	"--", "/*", "*/", "xp_", "sp_", "exec", "execute", "union", "select",
+	"insert", "update", "delete", "drop", "create", "alter",
+}
+
 // containsSuspiciousPatterns checks for potentially malicious input patterns
 func containsSuspiciousPatterns(query string) bool {
 	// Check for excessive special characters that might indicate injection attempts
@@ -22,11 +34,6 @@ func containsSuspiciousPatterns(query string) bool {
 	}
 
 	// Check for SQL-like patterns (even though we use parameterized queries)
-	suspiciousPatterns := []string{
-		"--", "/*", "*/", "xp_", "sp_", "exec", "execute", "union", "select",
-		"insert", "update", "delete", "drop", "create", "alter",
-	}
-
 	lowerQuery := strings.ToLower(query)
 	for _, pattern := range suspiciousPatterns {
 		if strings.Contains(lowerQuery, pattern) {
@@ -36,3 +43,43 @@ func containsSuspiciousPatterns(query string) bool {
 
 	return false
 }
+
+// normalizeTechnologies lowercases and trims technology names, dropping empty
+// and repeated entries. Technology names are stored in lowercase.
+func normalizeTechnologies(technologies []string) []string {
+	normalized := make([]string, 0, len(technologies))
+	for _, tech := range technologies {
+		name := strings.ToLower(strings.TrimSpace(tech))
+		if name != "" && !slices.Contains(normalized, name) {
+			normalized = append(normalized, name)
+		}
+	}
+	return normalized
+}
+
+// encodeCursor encodes a keyset cursor as an opaque URL-safe token.
+func encodeCursor(cursor Cursor) string {
+	data, err := json.Marshal(cursor)
+	if err != nil {
+		return ""
+	}
+	return base64.RawURLEncoding.EncodeToString(data)
+}
+
+// decodeCursor decodes a token produced by encodeCursor.
+func decodeCursor(token string) (*Cursor, error) {
+	data, err := base64.RawURLEncoding.DecodeString(token)
+	if err != nil {
+		return nil, fmt.Errorf("invalid cursor encoding: %w", err)
+	}
+
+	cursor := &Cursor{}
+	if err = json.Unmarshal(data, cursor); err != nil {
+		return nil, fmt.Errorf("invalid cursor payload: %w", err)
+	}
+	if cursor.ID <= 0 || cursor.CreatedAt.IsZero() {
+		return nil, errors.New("invalid cursor position")
+	}
+
+	return cursor, nil
+}
@@ -24,6 +24,7 @@ func MapJobToResponse(job *JobWithCompany, technologies []TechnologyResponse) *J
 		ApplicationURL:  job.ApplicationURL,
 		Technologies:    technologies,
 		PostedAt:        job.CreatedAt,
+		position:        job.Position,
 	}
 }
 
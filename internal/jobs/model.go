@@ -1,6 +1,7 @@
 package jobs
 
 import (
+	"encoding/json"
 	"time"
 )
 
@@ -30,6 +31,7 @@ type JobWithCompany struct {
 	Job                   // Embed the original Job struct
 	CompanyName    string `db:"company_name"`
 	CompanyLogoURL string `db:"company_logo_url"`
+	Position       int    // Zero-based position in the search results, set by job searches
 }
 
 // SearchParams defines parameters for job search (repository layer)
@@ -44,6 +46,14 @@ type SearchParams struct {
 	Company         *string
 	DateFrom        *time.Time
 	DateTo          *time.Time
+	Technologies    []string // Technology names; a job must be linked to all of them
+	Cursor          *Cursor  // Keyset position; results start after this job
+}
+
+// Cursor identifies the last job of a page for keyset pagination
+type Cursor struct {
+	CreatedAt time.Time `json:"created_at"`
+	ID        int       `json:"id"`
 }
 
 // GetLimit returns the limit for pagination to satisfy httpservice.SearchParams interface
@@ -55,3 +65,12 @@ func (sp *SearchParams) GetLimit() int {
 func (sp *SearchParams) GetOffset() int {
 	return sp.Offset
 }
+
+// CacheKey returns a key identifying these parameters to satisfy httpservice.CacheableSearchParams interface
+func (sp *SearchParams) CacheKey() string {
+	key, err := json.Marshal(sp)
+	if err != nil {
+		return ""
+	}
+	return string(key)
+}
@@ -5,9 +5,12 @@ import (
 	"errors"
 	"fmt"
 	"strings"
+	"time"
 
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgconn"
+
+	"github.com/rodruizronald/ticos-in-tech/internal/database"
 )
 
 // SQL query constants
@@ -27,6 +30,33 @@ const (
         RETURNING id, created_at, updated_at
     `
 
+	// Insert a job, or return the existing row with the same signature, in one
+	// statement. Only one branch of the UNION produces a row.
+	createOrGetJobQuery = `
+        WITH inserted AS (
+            INSERT INTO jobs (
+                company_id, title, description, experience_level, employment_type,
+                location, work_mode, application_url, is_active, signature
+            ) VALUES ($1, $2, $3, $4, $5, $6, $7, $8, $9, $10)
+            ON CONFLICT (signature) DO NOTHING
+            RETURNING id, created_at, updated_at
+        )
+        SELECT id, created_at, updated_at, TRUE AS created FROM inserted
+        UNION ALL
+        SELECT id, created_at, updated_at, FALSE AS created FROM jobs WHERE signature = $10
+        LIMIT 1
+    `
+
+	// Multi-row insert; the VALUES list is generated for each batch
+	createJobsBatchQuery = `
+        INSERT INTO jobs (
+            company_id, title, description, experience_level, employment_type,
+            location, work_mode, application_url, is_active, signature
+        ) VALUES %s
+        ON CONFLICT (signature) DO NOTHING
+        RETURNING id, signature, created_at, updated_at
+    `
+
 	getJobByIDQuery = selectJobBaseQuery + `
         WHERE id = $1
     `
@@ -35,6 +65,10 @@ const (
         WHERE signature = $1
     `
 
+	getJobsBySignaturesQuery = selectJobBaseQuery + `
+        WHERE signature = ANY($1)
+    `
+
 	updateJobQuery = `
         UPDATE jobs
         SET company_id = $1, title = $2, description = $3, experience_level = $4,
@@ -46,20 +80,81 @@ const (
 
 	deleteJobQuery = `DELETE FROM jobs WHERE id = $1`
 
-	// Full-text search query with company data and total count using window function
+	// Full-text search over active jobs with the total count from a window function.
+	// Filters and pagination are applied to jobs alone and only carry the narrow
+	// ordering columns; full job rows and company data are fetched for the rows of
+	// the requested page only (see searchJobsPageQuery).
 	searchJobsWithCountBaseQuery = `
         WITH search_query AS (
-            SELECT plainto_tsquery('english', $1) AS query
+            SELECT websearch_to_tsquery('english', $1) AS query
+        ),
+        page AS (
+            SELECT j.id, j.created_at, COUNT(*) OVER() as total_count, 0 as preceding_count
+            FROM jobs j, search_query sq
+            WHERE j.is_active = true AND j.search_vector @@ sq.query
+    `
+
+	// Keyset variant of searchJobsWithCountBaseQuery. The counts are taken over all
+	// matches and the cursor is applied outside of them (see searchJobsAfterCursorCondition),
+	// so the total is the same on every page and preceding_count holds the page's offset.
+	searchJobsFromCursorBaseQuery = `
+        WITH search_query AS (
+            SELECT websearch_to_tsquery('english', $1) AS query
+        ),
+        page AS (
+            SELECT j.id, j.created_at, j.total_count, j.preceding_count
+            FROM (
+                SELECT j.id, j.created_at, COUNT(*) OVER() as total_count,
+                    COUNT(*) FILTER (WHERE (j.created_at, j.id) >= ($%[1]d, $%[2]d)) OVER() as preceding_count
+                FROM jobs j, search_query sq
+                WHERE j.is_active = true AND j.search_vector @@ sq.query
+    `
+
+	// Closes the matches of searchJobsFromCursorBaseQuery and keeps the jobs after the cursor
+	searchJobsAfterCursorCondition = `
+            ) j
+            WHERE (j.created_at, j.id) < ($%d, $%d)
+    `
+
+	// Closes the page CTE with ordering and pagination, then loads the page's jobs
+	// and their company data
+	searchJobsPageQuery = `
+            ORDER BY j.created_at DESC, j.id DESC
+            LIMIT $%d OFFSET $%d
         )
-        SELECT 
+        SELECT
             j.id, j.company_id, j.title, j.description, j.experience_level, j.employment_type,
             j.location, j.work_mode, j.application_url, j.is_active, j.signature, j.created_at, j.updated_at,
             c.name as company_name, c.logo_url as company_logo_url,
-            COUNT(*) OVER() as total_count
-        FROM jobs j
-        JOIN companies c ON j.company_id = c.id, search_query sq
-        WHERE j.is_active = true AND j.search_vector @@ sq.query
+            p.total_count, p.preceding_count
+        FROM page p
+        JOIN jobs j ON j.id = p.id
+        JOIN companies c ON j.company_id = c.id
+        ORDER BY p.created_at DESC, p.id DESC
     `
+
+	// Filter condition matching jobs whose company name contains the given text
+	companyFilterCondition = `j.company_id IN (SELECT id FROM companies WHERE LOWER(name) LIKE LOWER($%d))`
+
+	// Filter condition for a single requested technology; a semi-join that stops
+	// at the first matching association, with no grouping
+	technologyFilterCondition = `EXISTS (
+            SELECT 1
+            FROM job_technologies jt
+            JOIN technologies t ON jt.technology_id = t.id
+            WHERE jt.job_id = j.id AND t.name = $%d
+        )`
+
+	// Filter condition matching jobs linked to every requested technology in a
+	// single aggregation over job_technologies
+	technologiesFilterCondition = `j.id IN (
+            SELECT jt.job_id
+            FROM job_technologies jt
+            JOIN technologies t ON jt.technology_id = t.id
+            WHERE t.name = ANY($%d)
+            GROUP BY jt.job_id
+            HAVING COUNT(DISTINCT jt.technology_id) = $%d
+        )`
 )
 
 // Constants for pagination
@@ -67,6 +162,15 @@ const (
 	// Default pagination limit for search requests. Can be overridden by clients.
 	DefaultLimit = 20
 	MaxLimit     = 100
+	// Offset pagination is only allowed for shallow pages; deeper pages use cursors.
+	MaxOffset = 1000
+)
+
+// Constants for batch operations
+const (
+	// CreateBatchSize is the maximum number of jobs inserted per statement.
+	CreateBatchSize  = 500
+	createJobColumns = 10
 )
 
 // Database interface to support pgxpool and mocks
@@ -92,6 +196,78 @@ func (r *Repository) SearchJobsWithCount(ctx context.Context, params *SearchPara
 	params.Query = strings.TrimSpace(params.Query)
 
 	// Build additional WHERE conditions
+	additionalWhere, args := buildSearchFilters(params)
+	searchQuery := searchJobsWithCountBaseQuery + additionalWhere
+
+	// Keyset pagination; the cursor only limits the page, not the counted matches
+	if params.Cursor != nil {
+		cursorArg := len(args) + 1
+		searchQuery = fmt.Sprintf(searchJobsFromCursorBaseQuery, cursorArg, cursorArg+1) + additionalWhere +
+			fmt.Sprintf(searchJobsAfterCursorCondition, cursorArg, cursorArg+1)
+		args = append(args, params.Cursor.CreatedAt, params.Cursor.ID)
+	}
+
+	// Build final search query with ordering and pagination
+	argCount := len(args) + 1
+	searchQuery += fmt.Sprintf(searchJobsPageQuery, argCount, argCount+1)
+
+	// Add pagination parameters
+	args = append(args, params.Limit, params.Offset)
+
+	// Execute search query
+	rows, err := r.db.Query(ctx, searchQuery, args...)
+	if err != nil {
+		return nil, 0, fmt.Errorf("failed to search jobs: %w", err)
+	}
+	defer rows.Close()
+
+	// Size the result slice for a full page up front
+	jobs := make([]*JobWithCompany, 0, min(max(params.Limit, 0), MaxLimit))
+	var total, preceding int
+
+	for rows.Next() {
+		job := &JobWithCompany{}
+		err = rows.Scan(
+			&job.ID,
+			&job.CompanyID,
+			&job.Title,
+			&job.Description,
+			&job.ExperienceLevel,
+			&job.EmploymentType,
+			&job.Location,
+			&job.WorkMode,
+			&job.ApplicationURL,
+			&job.IsActive,
+			&job.Signature,
+			&job.CreatedAt,
+			&job.UpdatedAt,
+			&job.CompanyName,
+			&job.CompanyLogoURL,
+			&total, // Window function gives us the same total for each row
+			&preceding,
+		)
+		if err != nil {
+			return nil, 0, fmt.Errorf("failed to scan job row: %w", err)
+		}
+		job.Position = preceding + params.Offset + len(jobs)
+		jobs = append(jobs, job)
+	}
+
+	if err = rows.Err(); err != nil {
+		return nil, 0, fmt.Errorf("error iterating job rows: %w", err)
+	}
+
+	// If no results, total should be 0
+	if len(jobs) == 0 {
+		total = 0
+	}
+
+	return jobs, total, nil
+}
+
+// buildSearchFilters builds the optional filter conditions of a job search and
+// their arguments. The search query is always the first argument.
+func buildSearchFilters(params *SearchParams) (string, []any) {
 	whereConditions := []string{}
 	args := []any{params.Query}
 	argCount := 2 // Starting at 2 because $1 is the search query
@@ -122,7 +298,7 @@ func (r *Repository) SearchJobsWithCount(ctx context.Context, params *SearchPara
 	}
 
 	if params.Company != nil {
-		whereConditions = append(whereConditions, fmt.Sprintf("LOWER(c.name) LIKE LOWER($%d)", argCount))
+		whereConditions = append(whereConditions, fmt.Sprintf(companyFilterCondition, argCount))
 		args = append(args, "%"+*params.Company+"%")
 		argCount++
 	}
@@ -139,65 +315,30 @@ func (r *Repository) SearchJobsWithCount(ctx context.Context, params *SearchPara
 		argCount++
 	}
 
-	// Build additional WHERE clause
-	additionalWhere := ""
-	if len(whereConditions) > 0 {
-		additionalWhere = " AND " + strings.Join(whereConditions, " AND ")
+	// All requested technologies must be linked to the job
+	if len(params.Technologies) > 0 {
+		condition, techArgs := buildTechnologiesFilter(params.Technologies, argCount)
+		whereConditions = append(whereConditions, condition)
+		args = append(args, techArgs...)
+		argCount += len(techArgs)
 	}
 
-	// Build final search query with ordering and pagination
-	searchQuery := searchJobsWithCountBaseQuery + additionalWhere +
-		fmt.Sprintf(" ORDER BY j.created_at DESC LIMIT $%d OFFSET $%d", argCount, argCount+1)
-
-	// Add pagination parameters
-	args = append(args, params.Limit, params.Offset)
-
-	// Execute search query
-	rows, err := r.db.Query(ctx, searchQuery, args...)
-	if err != nil {
-		return nil, 0, fmt.Errorf("failed to search jobs: %w", err)
+	if len(whereConditions) == 0 {
+		return "", args
 	}
-	defer rows.Close()
 
-	var jobs []*JobWithCompany
-	var total int
-
-	for rows.Next() {
-		job := &JobWithCompany{}
-		err = rows.Scan(
-			&job.ID,
-			&job.CompanyID,
-			&job.Title,
-			&job.Description,
-			&job.ExperienceLevel,
-			&job.EmploymentType,
-			&job.Location,
-			&job.WorkMode,
-			&job.ApplicationURL,
-			&job.IsActive,
-			&job.Signature,
-			&job.CreatedAt,
-			&job.UpdatedAt,
-			&job.CompanyName,
-			&job.CompanyLogoURL,
-			&total, // Window function gives us the same total for each row
-		)
-		if err != nil {
-			return nil, 0, fmt.Errorf("failed to scan job row: %w", err)
-		}
-		jobs = append(jobs, job)
-	}
-
-	if err = rows.Err(); err != nil {
-		return nil, 0, fmt.Errorf("error iterating job rows: %w", err)
-	}
+	return " AND " + strings.Join(whereConditions, " AND "), args
+}
 
-	// If no results, total should be 0
-	if len(jobs) == 0 {
-		total = 0
+// buildTechnologiesFilter returns the condition requiring every technology to be
+// linked to the job, and its arguments numbered from argCount. A single
+// technology, the common case, uses a plain EXISTS instead of the grouped subquery.
+func buildTechnologiesFilter(technologies []string, argCount int) (string, []any) {
+	if len(technologies) == 1 {
+		return fmt.Sprintf(technologyFilterCondition, argCount), []any{technologies[0]}
 	}
 
-	return jobs, total, nil
+	return fmt.Sprintf(technologiesFilterCondition, argCount, argCount+1), []any{technologies, len(technologies)}
 }
 
 // Create inserts a new job into the database.
@@ -219,8 +360,7 @@ func (r *Repository) Create(ctx context.Context, job *Job) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate job signature)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Signature: job.Signature}
 		}
 		return fmt.Errorf("failed to create job: %w", err)
@@ -229,6 +369,126 @@ func (r *Repository) Create(ctx context.Context, job *Job) error {
 	return nil
 }
 
+// CreateOrGet inserts a job, or loads the ID and timestamps of the existing job
+// with the same signature, in a single round trip; only a race with a concurrent
+// insert of the same signature costs a second read. It reports whether a new row
+// was created.
+func (r *Repository) CreateOrGet(ctx context.Context, job *Job) (bool, error) {
+	var created bool
+	err := r.db.QueryRow(
+		ctx,
+		createOrGetJobQuery,
+		job.CompanyID,
+		job.Title,
+		job.Description,
+		job.ExperienceLevel,
+		job.EmploymentType,
+		job.Location,
+		job.WorkMode,
+		job.ApplicationURL,
+		job.IsActive,
+		job.Signature,
+	).Scan(&job.ID, &job.CreatedAt, &job.UpdatedAt, &created)
+	if errors.Is(err, pgx.ErrNoRows) {
+		// A concurrent insert of the same signature committed after this statement's
+		// snapshot was taken, so neither branch saw a row; a fresh read finds it
+		existing, getErr := r.GetBySignature(ctx, job.Signature)
+		if getErr != nil {
+			return false, fmt.Errorf("failed to create or get job: %w", getErr)
+		}
+		job.ID, job.CreatedAt, job.UpdatedAt = existing.ID, existing.CreatedAt, existing.UpdatedAt
+		return false, nil
+	}
+	if err != nil {
+		return false, fmt.Errorf("failed to create or get job: %w", err)
+	}
+
+	return created, nil
+}
+
+// CreateBatch inserts multiple jobs using multi-row INSERT statements of up to
+// CreateBatchSize rows each. Jobs whose signature already exists are skipped and
+// keep a zero ID. It returns the number of jobs inserted.
+func (r *Repository) CreateBatch(ctx context.Context, jobs []*Job) (int, error) {
+	inserted := 0
+	for start := 0; start < len(jobs); start += CreateBatchSize {
+		end := min(start+CreateBatchSize, len(jobs))
+		n, err := r.createBatch(ctx, jobs[start:end])
+		if err != nil {
+			return inserted, err
+		}
+		inserted += n
+	}
+
+	return inserted, nil
+}
+
+// createBatch inserts a single batch of jobs with one statement.
+func (r *Repository) createBatch(ctx context.Context, batch []*Job) (int, error) {
+	args := make([]any, 0, len(batch)*createJobColumns)
+	bySignature := make(map[string]*Job, len(batch))
+	for _, job := range batch {
+		args = append(args,
+			job.CompanyID,
+			job.Title,
+			job.Description,
+			job.ExperienceLevel,
+			job.EmploymentType,
+			job.Location,
+			job.WorkMode,
+			job.ApplicationURL,
+			job.IsActive,
+			job.Signature,
+		)
+		bySignature[job.Signature] = job
+	}
+
+	rows, err := r.db.Query(ctx, buildCreateJobsBatchQuery(len(batch)), args...)
+	if err != nil {
+		return 0, fmt.Errorf("failed to create jobs: %w", err)
+	}
+	defer rows.Close()
+
+	inserted := 0
+	for rows.Next() {
+		var (
+			id        int
+			signature string
+			createdAt time.Time
+			updatedAt time.Time
+		)
+		if err = rows.Scan(&id, &signature, &createdAt, &updatedAt); err != nil {
+			return 0, fmt.Errorf("failed to scan created job row: %w", err)
+		}
+		if job, ok := bySignature[signature]; ok {
+			job.ID = id
+			job.CreatedAt = createdAt
+			job.UpdatedAt = updatedAt
+		}
+		inserted++
+	}
+
+	if err = rows.Err(); err != nil {
+		return 0, fmt.Errorf("error iterating created job rows: %w", err)
+	}
+
+	return inserted, nil
+}
+
+// buildCreateJobsBatchQuery builds the multi-row insert query for n jobs.
+func buildCreateJobsBatchQuery(n int) string {
+	values := make([]string, n)
+	placeholders := make([]string, createJobColumns)
+	for i := range n {
+		for j := range placeholders {
+			placeholders[j] = fmt.Sprintf("$%d", i*createJobColumns+j+1)
+		}
+		values[i] = "(" + strings.Join(placeholders, ", ") + ")"
+	}
+
+	return fmt.Sprintf(createJobsBatchQuery, strings.Join(values, ", "))
+}
+
 // GetByID retrieves a job by its ID.
 func (r *Repository) GetByID(ctx context.Context, id int) (*Job, error) {
 	job := &Job{}
@@ -282,8 +542,7 @@ func (r *Repository) Update(ctx context.Context, job *Job) error {
 		}
 
 		// Check for unique constraint violation (duplicate job signature)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Signature: job.Signature}
 		}
 
@@ -335,3 +594,48 @@ func (r *Repository) GetBySignature(ctx context.Context, signature string) (*Job
 
 	return job, nil
 }
+
+// GetBySignatures retrieves several jobs at once, keyed by signature. Signatures
+// without a job are absent from the map, so callers can tell new jobs apart
+// without one query per job.
+func (r *Repository) GetBySignatures(ctx context.Context, signatures []string) (map[string]*Job, error) {
+	jobs := make(map[string]*Job, len(signatures))
+	if len(signatures) == 0 {
+		return jobs, nil
+	}
+
+	rows, err := r.db.Query(ctx, getJobsBySignaturesQuery, signatures)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get jobs by signatures: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		job := &Job{}
+		err = rows.Scan(
+			&job.ID,
+			&job.CompanyID,
+			&job.Title,
+			&job.Description,
+			&job.ExperienceLevel,
+			&job.EmploymentType,
+			&job.Location,
+			&job.WorkMode,
+			&job.ApplicationURL,
+			&job.IsActive,
+			&job.Signature,
+			&job.CreatedAt,
+			&job.UpdatedAt,
+		)
+		if err != nil {
+			return nil, fmt.Errorf("failed to scan job row: %w", err)
+		}
+		jobs[job.Signature] = job
+	}
+
+	if err = rows.Err(); err != nil {
+		return nil, fmt.Errorf("error iterating job rows: %w", err)
+	}
+
+	return jobs, nil
+}
@@ -3,6 +3,7 @@ package jobs
 import (
 	"context"
 	"errors"
+	"fmt"
 	"regexp"
 	"testing"
 	"time"
@@ -167,6 +168,271 @@ func TestRepository_Create(t *testing.T) {
 	}
 }
 
+func TestRepository_CreateOrGet(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	newJob := func() *Job {
+		return &Job{
+			CompanyID:       1,
+			Title:           "Software Engineer",
+			Description:     "Job description",
+			ExperienceLevel: "Mid-Level",
+			EmploymentType:  "Full-Time",
+			Location:        "San Francisco",
+			WorkMode:        "Remote",
+			ApplicationURL:  "https://example.com/apply",
+			IsActive:        true,
+			Signature:       "job-signature-1",
+		}
+	}
+
+	expectCreateOrGet := func(mock pgxmock.PgxPoolIface, job *Job) *pgxmock.ExpectedQuery {
+		return mock.ExpectQuery(regexp.QuoteMeta(createOrGetJobQuery)).
+			WithArgs(
+				job.CompanyID,
+				job.Title,
+				job.Description,
+				job.ExperienceLevel,
+				job.EmploymentType,
+				job.Location,
+				job.WorkMode,
+				job.ApplicationURL,
+				job.IsActive,
+				job.Signature,
+			)
+	}
+
+	tests := []struct {
+		name         string
+		mockSetup    func(mock pgxmock.PgxPoolIface, job *Job)
+		checkResults func(t *testing.T, result *Job, created bool, err error)
+	}{
+		{
+			name: "new job is created",
+			mockSetup: func(mock pgxmock.PgxPoolIface, job *Job) {
+				t.Helper()
+				expectCreateOrGet(mock, job).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "created_at", "updated_at", "created",
+					}).AddRow(1, now, now, true))
+			},
+			checkResults: func(t *testing.T, result *Job, created bool, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.True(t, created)
+				assert.Equal(t, 1, result.ID)
+				assert.Equal(t, now, result.CreatedAt)
+			},
+		},
+		{
+			name: "existing job is returned",
+			mockSetup: func(mock pgxmock.PgxPoolIface, job *Job) {
+				t.Helper()
+				expectCreateOrGet(mock, job).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "created_at", "updated_at", "created",
+					}).AddRow(7, now, now, false))
+			},
+			checkResults: func(t *testing.T, result *Job, created bool, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.False(t, created)
+				assert.Equal(t, 7, result.ID)
+			},
+		},
+		{
+			name: "concurrent insert is read back",
+			mockSetup: func(mock pgxmock.PgxPoolIface, job *Job) {
+				t.Helper()
+				expectCreateOrGet(mock, job).WillReturnError(pgx.ErrNoRows)
+				mock.ExpectQuery(regexp.QuoteMeta(getJobBySignatureQuery)).
+					WithArgs(job.Signature).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "company_id", "title", "description", "experience_level",
+						"employment_type", "location", "work_mode", "application_url",
+						"is_active", "signature", "created_at", "updated_at",
+					}).AddRow(
+						9, job.CompanyID, job.Title, job.Description, job.ExperienceLevel,
+						job.EmploymentType, job.Location, job.WorkMode, job.ApplicationURL,
+						job.IsActive, job.Signature, now, now,
+					))
+			},
+			checkResults: func(t *testing.T, result *Job, created bool, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.False(t, created)
+				assert.Equal(t, 9, result.ID)
+				assert.Equal(t, now, result.CreatedAt)
+			},
+		},
+		{
+			name: "database error",
+			mockSetup: func(mock pgxmock.PgxPoolIface, job *Job) {
+				t.Helper()
+				expectCreateOrGet(mock, job).WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, _ *Job, created bool, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+				assert.False(t, created)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			job := newJob()
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB, job)
+
+			created, err := repo.CreateOrGet(context.Background(), job)
+			tt.checkResults(t, job, created, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
+func TestRepository_CreateBatch(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	newJobs := func() []*Job {
+		return []*Job{
+			{
+				CompanyID:       1,
+				Title:           "Software Engineer",
+				Description:     "Job description",
+				ExperienceLevel: "Mid-Level",
+				EmploymentType:  "Full-Time",
+				Location:        "Costa Rica",
+				WorkMode:        "Remote",
+				ApplicationURL:  "https://example.com/apply",
+				IsActive:        true,
+				Signature:       "job-signature-1",
+			},
+			{
+				CompanyID:       1,
+				Title:           "Product Manager",
+				Description:     "Another description",
+				ExperienceLevel: "Senior",
+				EmploymentType:  "Full-Time",
+				Location:        "LATAM",
+				WorkMode:        "Hybrid",
+				ApplicationURL:  "https://example.com/apply2",
+				IsActive:        true,
+				Signature:       "job-signature-2",
+			},
+		}
+	}
+
+	jobArgs := func(jobs []*Job) []any {
+		args := []any{}
+		for _, job := range jobs {
+			args = append(args,
+				job.CompanyID, job.Title, job.Description, job.ExperienceLevel, job.EmploymentType,
+				job.Location, job.WorkMode, job.ApplicationURL, job.IsActive, job.Signature,
+			)
+		}
+		return args
+	}
+
+	tests := []struct {
+		name         string
+		mockSetup    func(mock pgxmock.PgxPoolIface, jobs []*Job)
+		checkResults func(t *testing.T, jobs []*Job, inserted int, err error)
+	}{
+		{
+			name: "all jobs inserted in one statement",
+			mockSetup: func(mock pgxmock.PgxPoolIface, jobs []*Job) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildCreateJobsBatchQuery(2))).
+					WithArgs(jobArgs(jobs)...).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "signature", "created_at", "updated_at",
+					}).AddRow(1, "job-signature-1", now, now).AddRow(2, "job-signature-2", now, now))
+			},
+			checkResults: func(t *testing.T, jobs []*Job, inserted int, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 2, inserted)
+				assert.Equal(t, 1, jobs[0].ID)
+				assert.Equal(t, 2, jobs[1].ID)
+				assert.Equal(t, now, jobs[1].CreatedAt)
+			},
+		},
+		{
+			name: "existing signature is skipped",
+			mockSetup: func(mock pgxmock.PgxPoolIface, jobs []*Job) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildCreateJobsBatchQuery(2))).
+					WithArgs(jobArgs(jobs)...).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "signature", "created_at", "updated_at",
+					}).AddRow(3, "job-signature-2", now, now))
+			},
+			checkResults: func(t *testing.T, jobs []*Job, inserted int, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 1, inserted)
+				assert.Zero(t, jobs[0].ID)
+				assert.Equal(t, 3, jobs[1].ID)
+			},
+		},
+		{
+			name: "database error",
+			mockSetup: func(mock pgxmock.PgxPoolIface, jobs []*Job) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildCreateJobsBatchQuery(2))).
+					WithArgs(jobArgs(jobs)...).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, _ []*Job, inserted int, err error) {
+				t.Helper()
+				require.Error(t, err)
+				assert.Zero(t, inserted)
+				require.ErrorIs(t, err, dbError)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			jobs := newJobs()
+			tt.mockSetup(mockDB, jobs)
+
+			inserted, err := repo.CreateBatch(context.Background(), jobs)
+			tt.checkResults(t, jobs, inserted, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
+func TestBuildCreateJobsBatchQuery(t *testing.T) {
+	t.Parallel()
+
+	query := buildCreateJobsBatchQuery(2)
+
+	assert.Contains(t, query, "($1, $2, $3, $4, $5, $6, $7, $8, $9, $10), ($11, $12, $13, $14, $15, $16, $17, $18, $19, $20)")
+	assert.Contains(t, query, "ON CONFLICT (signature) DO NOTHING")
+}
+
 func TestRepository_GetByID(t *testing.T) {
 	t.Parallel()
 	now := time.Now()
@@ -641,6 +907,94 @@ func TestRepository_GetBySignature(t *testing.T) {
 	}
 }
 
+func TestRepository_GetBySignatures(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	tests := []struct {
+		name         string
+		signatures   []string
+		mockSetup    func(mock pgxmock.PgxPoolIface, signatures []string)
+		checkResults func(t *testing.T, result map[string]*Job, err error)
+	}{
+		{
+			name:       "returns existing jobs by signature",
+			signatures: []string{"job-signature-1", "job-signature-2", "new-signature"},
+			mockSetup: func(mock pgxmock.PgxPoolIface, signatures []string) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(getJobsBySignaturesQuery)).
+					WithArgs(signatures).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "company_id", "title", "description", "experience_level", "employment_type",
+						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
+					}).
+						AddRow(
+							1, 1, "Software Engineer", "Job description", "Mid-Level", "Full-Time",
+							"San Francisco", "Remote", "https://example.com/apply/1", true, "job-signature-1", now, now,
+						).
+						AddRow(
+							2, 1, "Data Engineer", "Job description", "Senior", "Full-Time",
+							"San Jose", "Hybrid", "https://example.com/apply/2", true, "job-signature-2", now, now,
+						))
+			},
+			checkResults: func(t *testing.T, result map[string]*Job, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				require.Len(t, result, 2)
+				assert.Equal(t, 1, result["job-signature-1"].ID)
+				assert.Equal(t, "Software Engineer", result["job-signature-1"].Title)
+				assert.Equal(t, 2, result["job-signature-2"].ID)
+				assert.Equal(t, "Data Engineer", result["job-signature-2"].Title)
+				assert.NotContains(t, result, "new-signature")
+			},
+		},
+		{
+			name:       "no signatures skips the query",
+			signatures: nil,
+			mockSetup:  func(_ pgxmock.PgxPoolIface, _ []string) {},
+			checkResults: func(t *testing.T, result map[string]*Job, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Empty(t, result)
+			},
+		},
+		{
+			name:       "database error",
+			signatures: []string{"job-signature-1"},
+			mockSetup: func(mock pgxmock.PgxPoolIface, signatures []string) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(getJobsBySignaturesQuery)).
+					WithArgs(signatures).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, result map[string]*Job, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+				assert.Nil(t, result)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB, tt.signatures)
+
+			result, err := repo.GetBySignatures(context.Background(), tt.signatures)
+			tt.checkResults(t, result, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
 func TestRepository_SearchJobsWithCount(t *testing.T) {
 	t.Parallel()
 	now := time.Now()
@@ -663,21 +1017,21 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("software engineer", 10, 0).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}).AddRow(
 						1, 1, "Software Engineer", "Job description", "Mid-Level", "Full-Time",
 						"San Francisco", "Remote", "https://example.com/apply", true, "job-signature-1", now, now,
-						"Tech Corp", "https://example.com/logo1.png", 25,
+						"Tech Corp", "https://example.com/logo1.png", 25, 0,
 					).AddRow(
 						2, 2, "Senior Software Engineer", "Senior position", "Senior", "Full-Time",
 						"New York", "Hybrid", "https://example.com/apply2", true, "job-signature-2", now, now,
-						"Innovation Inc", "https://example.com/logo2.png", 25,
+						"Innovation Inc", "https://example.com/logo2.png", 25, 0,
 					))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -713,18 +1067,18 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 				t.Helper()
 				expectedQuery := searchJobsWithCountBaseQuery +
 					" AND j.experience_level = $2 AND j.employment_type = $3 AND j.location = $4 AND j.work_mode = $5" +
-					" AND LOWER(c.name) LIKE LOWER($6) AND j.created_at >= $7 AND j.created_at <= $8" +
-					" ORDER BY j.created_at DESC LIMIT $9 OFFSET $10"
+					" AND " + fmt.Sprintf(companyFilterCondition, 6) + " AND j.created_at >= $7 AND j.created_at <= $8" +
+					fmt.Sprintf(searchJobsPageQuery, 9, 10)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("developer", "Senior", "Full-Time", "San Francisco", "Remote", "%StartupXYZ%", dateFrom, dateTo, 5, 10).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}).AddRow(
 						3, 3, "Senior Developer", "Senior developer position", "Senior", "Full-Time",
 						"San Francisco", "Remote", "https://example.com/apply3", true, "job-signature-3", now, now,
-						"StartupXYZ", "https://example.com/logo3.png", 42,
+						"StartupXYZ", "https://example.com/logo3.png", 42, 0,
 					))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -740,6 +1094,107 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 				assert.Equal(t, "Remote", jobs[0].WorkMode)
 				assert.Equal(t, "StartupXYZ", jobs[0].CompanyName)
 				assert.Equal(t, "https://example.com/logo3.png", jobs[0].CompanyLogoURL)
+				assert.Equal(t, 10, jobs[0].Position)
+			},
+		},
+		{
+			name: "search with technology filters",
+			params: SearchParams{
+				Query:        "developer",
+				Limit:        10,
+				Offset:       0,
+				Technologies: []string{"golang", "postgresql"},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
+				t.Helper()
+				expectedQuery := searchJobsWithCountBaseQuery +
+					" AND " + fmt.Sprintf(technologiesFilterCondition, 2, 3) +
+					fmt.Sprintf(searchJobsPageQuery, 4, 5)
+				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
+					WithArgs("developer", []string{"golang", "postgresql"}, 2, 10, 0).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "company_id", "title", "description", "experience_level", "employment_type",
+						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
+					}).AddRow(
+						4, 1, "Go Developer", "Go and PostgreSQL", "Mid-level", "Full-time",
+						"Costa Rica", "Remote", "https://example.com/apply4", true, "job-signature-4", now, now,
+						"Tech Corp", "https://example.com/logo1.png", 1, 0,
+					))
+			},
+			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Len(t, jobs, 1)
+				assert.Equal(t, 1, total)
+				assert.Equal(t, "Go Developer", jobs[0].Title)
+			},
+		},
+		{
+			name: "search with a single technology filter",
+			params: SearchParams{
+				Query:        "developer",
+				Limit:        10,
+				Offset:       0,
+				Technologies: []string{"golang"},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
+				t.Helper()
+				expectedQuery := searchJobsWithCountBaseQuery +
+					" AND " + fmt.Sprintf(technologyFilterCondition, 2) +
+					fmt.Sprintf(searchJobsPageQuery, 3, 4)
+				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
+					WithArgs("developer", "golang", 10, 0).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "company_id", "title", "description", "experience_level", "employment_type",
+						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
+					}).AddRow(
+						4, 1, "Go Developer", "Go and PostgreSQL", "Mid-level", "Full-time",
+						"Costa Rica", "Remote", "https://example.com/apply4", true, "job-signature-4", now, now,
+						"Tech Corp", "https://example.com/logo1.png", 1, 0,
+					))
+			},
+			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Len(t, jobs, 1)
+				assert.Equal(t, 1, total)
+				assert.Equal(t, "Go Developer", jobs[0].Title)
+			},
+		},
+		{
+			name: "search with keyset cursor",
+			params: SearchParams{
+				Query:  "developer",
+				Limit:  10,
+				Offset: 0,
+				Cursor: &Cursor{CreatedAt: dateFrom, ID: 42},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
+				t.Helper()
+				expectedQuery := fmt.Sprintf(searchJobsFromCursorBaseQuery, 2, 3) +
+					fmt.Sprintf(searchJobsAfterCursorCondition, 2, 3) +
+					fmt.Sprintf(searchJobsPageQuery, 4, 5)
+				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
+					WithArgs("developer", dateFrom, 42, 10, 0).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "company_id", "title", "description", "experience_level", "employment_type",
+						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
+					}).AddRow(
+						41, 1, "Backend Developer", "Job description", "Mid-level", "Full-time",
+						"Costa Rica", "Remote", "https://example.com/apply41", true, "job-signature-41", now, now,
+						"Tech Corp", "https://example.com/logo1.png", 35, 20,
+					))
+			},
+			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Len(t, jobs, 1)
+				assert.Equal(t, 35, total) // Counts all matches, not only those after the cursor
+				assert.Equal(t, 41, jobs[0].ID)
+				assert.Equal(t, 20, jobs[0].Position)
 			},
 		},
 		{
@@ -751,13 +1206,13 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("nonexistent job title", 20, 0).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -776,7 +1231,7 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("test query", 10, 0).
 					WillReturnError(dbError)
@@ -798,13 +1253,13 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("", 10, 0).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -823,13 +1278,13 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("", 10, 0). // Query should be trimmed to empty string
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -848,7 +1303,7 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("test query", 10, 0).
 					WillReturnRows(pgxmock.NewRows([]string{
@@ -874,17 +1329,17 @@ func TestRepository_SearchJobsWithCount(t *testing.T) {
 			},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ SearchParams) {
 				t.Helper()
-				expectedQuery := searchJobsWithCountBaseQuery + " ORDER BY j.created_at DESC LIMIT $2 OFFSET $3"
+				expectedQuery := searchJobsWithCountBaseQuery + fmt.Sprintf(searchJobsPageQuery, 2, 3)
 				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
 					WithArgs("golang", 1, 5).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "company_id", "title", "description", "experience_level", "employment_type",
 						"location", "work_mode", "application_url", "is_active", "signature", "created_at", "updated_at",
-						"company_name", "company_logo_url", "total_count",
+						"company_name", "company_logo_url", "total_count", "preceding_count",
 					}).AddRow(
 						6, 6, "Golang Developer", "Golang position", "Mid-level", "Full-Time",
 						"Remote", "Remote", "https://example.com/apply6", true, "job-signature-6", now, now,
-						"Go Corp", "https://example.com/logo6.png", 100,
+						"Go Corp", "https://example.com/logo6.png", 100, 0,
 					))
 			},
 			checkResults: func(t *testing.T, jobs []*JobWithCompany, total int, err error) {
@@ -8,6 +8,14 @@ const (
         RETURNING id, created_at
     `
 
+	// Multi-row upsert; the VALUES list is generated for each batch
+	upsertJobTechnologiesBatchQuery = `
+        INSERT INTO job_technologies (job_id, technology_id, is_required)
+        VALUES %s
+        ON CONFLICT (job_id, technology_id) DO UPDATE SET is_required = EXCLUDED.is_required
+        RETURNING id, job_id, technology_id, created_at
+    `
+
 	getJobTechnologyByJobAndTechQuery = `
         SELECT id, job_id, technology_id, is_required, created_at
         FROM job_technologies
@@ -41,7 +49,15 @@ const (
                t.name as tech_name, t.category as tech_category
         FROM job_technologies jt
         JOIN technologies t ON jt.technology_id = t.id
-        WHERE jt.job_id IN (%s)
+        WHERE jt.job_id = ANY($1)
         ORDER BY jt.job_id, t.name
     `
 )
+
+// Constants for batch operations
+const (
+	// UpsertBatchSize is the maximum number of associations upserted per statement.
+	UpsertBatchSize = 500
+	// Number of columns bound per row in upsertJobTechnologiesBatchQuery
+	upsertJobTechnologyColumns = 3
+)
@@ -5,9 +5,12 @@ import (
 	"errors"
 	"fmt"
 	"strings"
+	"time"
 
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgconn"
+
+	"github.com/rodruizronald/ticos-in-tech/internal/database"
 )
 
 // Database interface to support pgxpool and mocks
@@ -39,8 +42,7 @@ func (r *Repository) Create(ctx context.Context, jobTech *JobTechnology) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate job-technology association)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{
 				JobID:        jobTech.JobID,
 				TechnologyID: jobTech.TechnologyID,
@@ -52,6 +54,80 @@ func (r *Repository) Create(ctx context.Context, jobTech *JobTechnology) error {
 	return nil
 }
 
+// UpsertBatch inserts or refreshes multiple job-technology associations using
+// multi-row INSERT ... ON CONFLICT statements of up to UpsertBatchSize rows each,
+// and fills in their IDs and creation times. Repeated (job, technology) pairs are
+// sent once, using the required flag of the last occurrence.
+func (r *Repository) UpsertBatch(ctx context.Context, jobTechs []*JobTechnology) error {
+	for start := 0; start < len(jobTechs); start += UpsertBatchSize {
+		end := min(start+UpsertBatchSize, len(jobTechs))
+		if err := r.upsertBatch(ctx, jobTechs[start:end]); err != nil {
+			return err
+		}
+	}
+
+	return nil
+}
+
+// upsertBatch upserts a single batch of associations with one statement.
+func (r *Repository) upsertBatch(ctx context.Context, jobTechs []*JobTechnology) error {
+	// A single statement cannot update the same row twice, so collapse duplicates
+	type pairKey struct{ jobID, technologyID int }
+	byPair := make(map[pairKey][]*JobTechnology, len(jobTechs))
+	pairs := make([]pairKey, 0, len(jobTechs))
+	for _, jobTech := range jobTechs {
+		key := pairKey{jobID: jobTech.JobID, technologyID: jobTech.TechnologyID}
+		if _, ok := byPair[key]; !ok {
+			pairs = append(pairs, key)
+		}
+		byPair[key] = append(byPair[key], jobTech)
+	}
+
+	args := make([]any, 0, len(pairs)*upsertJobTechnologyColumns)
+	for _, key := range pairs {
+		entries := byPair[key]
+		args = append(args, key.jobID, key.technologyID, entries[len(entries)-1].IsRequired)
+	}
+
+	rows, err := r.db.Query(ctx, buildUpsertJobTechnologiesBatchQuery(len(pairs)), args...)
+	if err != nil {
+		return fmt.Errorf("failed to upsert job technology associations: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var (
+			id        int
+			key       pairKey
+			createdAt time.Time
+		)
+		if err = rows.Scan(&id, &key.jobID, &key.technologyID, &createdAt); err != nil {
+			return fmt.Errorf("failed to scan upserted job technology row: %w", err)
+		}
+		for _, jobTech := range byPair[key] {
+			jobTech.ID = id
+			jobTech.CreatedAt = createdAt
+		}
+	}
+
+	if err = rows.Err(); err != nil {
+		return fmt.Errorf("error iterating upserted job technology rows: %w", err)
+	}
+
+	return nil
+}
+
+// buildUpsertJobTechnologiesBatchQuery builds the multi-row upsert query for n associations.
+func buildUpsertJobTechnologiesBatchQuery(n int) string {
+	values := make([]string, n)
+	for i := range n {
+		base := i * upsertJobTechnologyColumns
+		values[i] = fmt.Sprintf("($%d, $%d, $%d)", base+1, base+2, base+3)
+	}
+
+	return fmt.Sprintf(upsertJobTechnologiesBatchQuery, strings.Join(values, ", "))
+}
+
 // GetByJobAndTechnology retrieves a job-technology association by job ID and technology ID.
 func (r *Repository) GetByJobAndTechnology(ctx context.Context, jobID, technologyID int) (*JobTechnology, error) {
 	jobTech := &JobTechnology{}
@@ -87,8 +163,7 @@ func (r *Repository) Update(ctx context.Context, jobTech *JobTechnology) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate job-technology association)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{
 				JobID:        jobTech.JobID,
 				TechnologyID: jobTech.TechnologyID,
@@ -187,24 +262,16 @@ func (r *Repository) GetJobTechnologiesBatch(ctx context.Context, jobIDs []int)
 		return make(map[int][]*JobTechnologyWithDetails), nil
 	}
 
-	// Build query with IN clause for multiple job IDs
-	placeholders := make([]string, len(jobIDs))
-	args := make([]any, len(jobIDs))
-	for i, jobID := range jobIDs {
-		placeholders[i] = fmt.Sprintf("$%d", i+1)
-		args[i] = jobID
-	}
-
-	query := fmt.Sprintf(getJobTechnologiesBatchQuery, strings.Join(placeholders, ","))
-
-	rows, err := r.db.Query(ctx, query, args...)
+	// Pass the IDs as a single array parameter so every page size shares one
+	// statement text, and with it pgx's cached prepared statement and plan
+	rows, err := r.db.Query(ctx, getJobTechnologiesBatchQuery, jobIDs)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get job technologies: %w", err)
 	}
 	defer rows.Close()
 
 	// Group technologies by job ID
-	technologiesMap := make(map[int][]*JobTechnologyWithDetails)
+	technologiesMap := make(map[int][]*JobTechnologyWithDetails, len(jobIDs))
 	for rows.Next() {
 		tech := &JobTechnologyWithDetails{}
 		err = rows.Scan(
@@ -3,7 +3,6 @@ package jobtech
 import (
 	"context"
 	"errors"
-	"fmt"
 	"regexp"
 	"testing"
 	"time"
@@ -123,6 +122,146 @@ func TestRepository_Create(t *testing.T) {
 	}
 }
 
+func TestRepository_UpsertBatch(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	tests := []struct {
+		name         string
+		jobTechs     []*JobTechnology
+		mockSetup    func(mock pgxmock.PgxPoolIface)
+		checkResults func(t *testing.T, jobTechs []*JobTechnology, err error)
+	}{
+		{
+			name: "successful batch upsert",
+			jobTechs: []*JobTechnology{
+				{JobID: 1, TechnologyID: 10, IsRequired: true},
+				{JobID: 1, TechnologyID: 20, IsRequired: false},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertJobTechnologiesBatchQuery(2))).
+					WithArgs(1, 10, true, 1, 20, false).
+					WillReturnRows(pgxmock.NewRows([]string{"id", "job_id", "technology_id", "created_at"}).
+						AddRow(100, 1, 10, now).
+						AddRow(101, 1, 20, now))
+			},
+			checkResults: func(t *testing.T, jobTechs []*JobTechnology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 100, jobTechs[0].ID)
+				assert.Equal(t, 101, jobTechs[1].ID)
+				assert.Equal(t, now, jobTechs[1].CreatedAt)
+			},
+		},
+		{
+			name: "duplicate pairs are sent once",
+			jobTechs: []*JobTechnology{
+				{JobID: 1, TechnologyID: 10, IsRequired: false},
+				{JobID: 1, TechnologyID: 10, IsRequired: true},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertJobTechnologiesBatchQuery(1))).
+					WithArgs(1, 10, true).
+					WillReturnRows(pgxmock.NewRows([]string{"id", "job_id", "technology_id", "created_at"}).
+						AddRow(100, 1, 10, now))
+			},
+			checkResults: func(t *testing.T, jobTechs []*JobTechnology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 100, jobTechs[0].ID)
+				assert.Equal(t, 100, jobTechs[1].ID)
+			},
+		},
+		{
+			name:     "large input is split into batches",
+			jobTechs: newJobTechnologies(UpsertBatchSize + 1),
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				firstBatch := pgxmock.NewRows([]string{"id", "job_id", "technology_id", "created_at"})
+				for i := range UpsertBatchSize {
+					firstBatch.AddRow(100+i, 1, i+1, now)
+				}
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertJobTechnologiesBatchQuery(UpsertBatchSize))).
+					WillReturnRows(firstBatch)
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertJobTechnologiesBatchQuery(1))).
+					WithArgs(1, UpsertBatchSize+1, true).
+					WillReturnRows(pgxmock.NewRows([]string{"id", "job_id", "technology_id", "created_at"}).
+						AddRow(100+UpsertBatchSize, 1, UpsertBatchSize+1, now))
+			},
+			checkResults: func(t *testing.T, jobTechs []*JobTechnology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 100, jobTechs[0].ID)
+				assert.Equal(t, 100+UpsertBatchSize, jobTechs[UpsertBatchSize].ID)
+			},
+		},
+		{
+			name:      "empty batch",
+			jobTechs:  []*JobTechnology{},
+			mockSetup: func(_ pgxmock.PgxPoolIface) {},
+			checkResults: func(t *testing.T, _ []*JobTechnology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+			},
+		},
+		{
+			name: "database error",
+			jobTechs: []*JobTechnology{
+				{JobID: 1, TechnologyID: 10, IsRequired: true},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertJobTechnologiesBatchQuery(1))).
+					WithArgs(1, 10, true).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, _ []*JobTechnology, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB)
+
+			err = repo.UpsertBatch(context.Background(), tt.jobTechs)
+			tt.checkResults(t, tt.jobTechs, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
+// newJobTechnologies returns n required associations of job 1 with technologies 1 to n.
+func newJobTechnologies(n int) []*JobTechnology {
+	jobTechs := make([]*JobTechnology, n)
+	for i := range jobTechs {
+		jobTechs[i] = &JobTechnology{JobID: 1, TechnologyID: i + 1, IsRequired: true}
+	}
+	return jobTechs
+}
+
+func TestBuildUpsertJobTechnologiesBatchQuery(t *testing.T) {
+	t.Parallel()
+
+	query := buildUpsertJobTechnologiesBatchQuery(2)
+
+	assert.Contains(t, query, "VALUES ($1, $2, $3), ($4, $5, $6)")
+	assert.Contains(t, query, "ON CONFLICT (job_id, technology_id) DO UPDATE")
+}
+
 func TestRepository_GetByJobAndTechnology(t *testing.T) {
 	t.Parallel()
 	now := time.Now()
@@ -666,9 +805,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{1, 2},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1,$2")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(1, 2).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{1, 2}).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"job_id", "technology_id", "is_required", "tech_name", "tech_category",
 					}).AddRow(
@@ -722,9 +860,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{1},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(1).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{1}).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"job_id", "technology_id", "is_required", "tech_name", "tech_category",
 					}).AddRow(
@@ -763,9 +900,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{999, 888},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1,$2")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(999, 888).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{999, 888}).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"job_id", "technology_id", "is_required", "tech_name", "tech_category",
 					}))
@@ -781,9 +917,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{1, 2},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1,$2")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(1, 2).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{1, 2}).
 					WillReturnError(dbError)
 			},
 			checkResults: func(t *testing.T, results map[int][]*JobTechnologyWithDetails, err error) {
@@ -798,9 +933,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{1},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(1).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{1}).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"job_id", "technology_id", // Missing columns to cause scan error
 					}).AddRow(
@@ -819,9 +953,8 @@ func TestRepository_GetJobTechnologiesBatch(t *testing.T) {
 			jobIDs: []int{1, 2, 3},
 			mockSetup: func(mock pgxmock.PgxPoolIface, _ []int) {
 				t.Helper()
-				expectedQuery := fmt.Sprintf(getJobTechnologiesBatchQuery, "$1,$2,$3")
-				mock.ExpectQuery(regexp.QuoteMeta(expectedQuery)).
-					WithArgs(1, 2, 3).
+				mock.ExpectQuery(regexp.QuoteMeta(getJobTechnologiesBatchQuery)).
+					WithArgs([]int{1, 2, 3}).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"job_id", "technology_id", "is_required", "tech_name", "tech_category",
 					}).AddRow(
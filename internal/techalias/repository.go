@@ -7,6 +7,8 @@ import (
 
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgconn"
+
+	"github.com/rodruizronald/ticos-in-tech/internal/database"
 )
 
 // SQL query constants
@@ -73,8 +75,7 @@ func (r *Repository) Create(ctx context.Context, alias *TechnologyAlias) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate alias)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Alias: alias.Alias}
 		}
 		return fmt.Errorf("failed to create technology alias: %w", err)
@@ -134,8 +135,7 @@ func (r *Repository) Update(ctx context.Context, alias *TechnologyAlias) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate alias)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Alias: alias.Alias}
 		}
 		return fmt.Errorf("failed to update technology alias: %w", err)
@@ -4,10 +4,13 @@ import (
 	"context"
 	"errors"
 	"fmt"
+	"strings"
+	"time"
 
 	"github.com/jackc/pgx/v5"
 	"github.com/jackc/pgx/v5/pgconn"
 
+	"github.com/rodruizronald/ticos-in-tech/internal/database"
 	"github.com/rodruizronald/ticos-in-tech/internal/jobtech"
 	"github.com/rodruizronald/ticos-in-tech/internal/techalias"
 )
@@ -20,6 +23,15 @@ const (
         RETURNING id, created_at
     `
 
+	// Multi-row upsert by name; the VALUES list is generated for each batch and
+	// parent references are left to UpdateParent
+	upsertTechnologiesBatchQuery = `
+        INSERT INTO technologies (name, category)
+        VALUES %s
+        ON CONFLICT (name) DO UPDATE SET category = EXCLUDED.category
+        RETURNING id, name, created_at
+    `
+
 	getTechnologyByIDQuery = `
         SELECT id, name, category, parent_id, created_at
         FROM technologies
@@ -32,29 +44,67 @@ const (
         WHERE name = $1
     `
 
+	// Resolve a batch of aliases to their technologies in one round trip
+	getTechnologiesByAliasesQuery = `
+        SELECT a.alias, t.id, t.name, t.category, t.parent_id, t.created_at
+        FROM technology_aliases a
+        JOIN technologies t ON t.id = a.technology_id
+        WHERE a.alias = ANY($1)
+    `
+
 	updateTechnologyQuery = `
         UPDATE technologies
         SET name = $1, category = $2, parent_id = $3
         WHERE id = $4
     `
 
+	updateTechnologyParentQuery = `
+        UPDATE technologies
+        SET parent_id = $1
+        WHERE id = $2
+    `
+
 	deleteTechnologyQuery = `DELETE FROM technologies WHERE id = $1`
 
-	getTechnologyAliasesQuery = `
-        SELECT id, technology_id, alias, created_at
-        FROM technology_aliases
-        WHERE technology_id = $1
-        ORDER BY alias
+	// Keyset pagination over the unique name index
+	listTechnologiesQuery = `
+        SELECT id, name, category, parent_id, created_at
+        FROM technologies
+        WHERE name > $1
+        ORDER BY name
+        LIMIT $2
+    `
+
+	// Technology and its aliases in one round trip; a technology without aliases
+	// yields a single row with NULL alias columns
+	getTechnologyWithAliasesQuery = `
+        SELECT t.id, t.name, t.category, t.parent_id, t.created_at,
+               a.id, a.technology_id, a.alias, a.created_at
+        FROM technologies t
+        LEFT JOIN technology_aliases a ON a.technology_id = t.id
+        WHERE t.id = $1
+        ORDER BY a.alias
     `
 
-	getTechnologyJobsQuery = `
-        SELECT id, job_id, technology_id, is_primary, is_required, created_at
-        FROM job_technologies
-        WHERE technology_id = $1
-        ORDER BY created_at DESC
+	// Technology and its job associations in one round trip; a technology
+	// without jobs yields a single row with NULL association columns
+	getTechnologyWithJobsQuery = `
+        SELECT t.id, t.name, t.category, t.parent_id, t.created_at,
+               jt.id, jt.job_id, jt.technology_id, jt.is_required, jt.created_at
+        FROM technologies t
+        LEFT JOIN job_technologies jt ON jt.technology_id = t.id
+        WHERE t.id = $1
+        ORDER BY jt.created_at DESC
     `
 )
 
+// Constants for batch operations
+const (
+	// UpsertBatchSize is the maximum number of technologies upserted per statement.
+	UpsertBatchSize         = 500
+	upsertTechnologyColumns = 2
+)
+
 // Database interface to support pgxpool and mocks
 type Database interface {
 	QueryRow(ctx context.Context, query string, args ...any) pgx.Row
@@ -84,8 +134,7 @@ func (r *Repository) Create(ctx context.Context, tech *Technology) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate technology name)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Name: tech.Name}
 		}
 		return fmt.Errorf("failed to create technology: %w", err)
@@ -94,6 +143,78 @@ func (r *Repository) Create(ctx context.Context, tech *Technology) error {
 	return nil
 }
 
+// UpsertBatch inserts multiple technologies, or updates the category of those
+// whose name already exists, using multi-row statements of up to UpsertBatchSize
+// rows each, and fills in their IDs and creation times. Repeated names are sent
+// once, using the category of the last occurrence.
+func (r *Repository) UpsertBatch(ctx context.Context, techs []*Technology) error {
+	for start := 0; start < len(techs); start += UpsertBatchSize {
+		end := min(start+UpsertBatchSize, len(techs))
+		if err := r.upsertBatch(ctx, techs[start:end]); err != nil {
+			return err
+		}
+	}
+
+	return nil
+}
+
+// upsertBatch upserts a single batch of technologies with one statement.
+func (r *Repository) upsertBatch(ctx context.Context, batch []*Technology) error {
+	// A single statement cannot update the same row twice, so collapse duplicates
+	byName := make(map[string][]*Technology, len(batch))
+	names := make([]string, 0, len(batch))
+	for _, tech := range batch {
+		if _, ok := byName[tech.Name]; !ok {
+			names = append(names, tech.Name)
+		}
+		byName[tech.Name] = append(byName[tech.Name], tech)
+	}
+
+	args := make([]any, 0, len(names)*upsertTechnologyColumns)
+	for _, name := range names {
+		entries := byName[name]
+		args = append(args, name, entries[len(entries)-1].Category)
+	}
+
+	rows, err := r.db.Query(ctx, buildUpsertTechnologiesBatchQuery(len(names)), args...)
+	if err != nil {
+		return fmt.Errorf("failed to upsert technologies: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var (
+			id        int
+			name      string
+			createdAt time.Time
+		)
+		if err = rows.Scan(&id, &name, &createdAt); err != nil {
+			return fmt.Errorf("failed to scan upserted technology row: %w", err)
+		}
+		for _, tech := range byName[name] {
+			tech.ID = id
+			tech.CreatedAt = createdAt
+		}
+	}
+
+	if err = rows.Err(); err != nil {
+		return fmt.Errorf("error iterating upserted technology rows: %w", err)
+	}
+
+	return nil
+}
+
+// buildUpsertTechnologiesBatchQuery builds the multi-row upsert query for n technologies.
+func buildUpsertTechnologiesBatchQuery(n int) string {
+	values := make([]string, n)
+	for i := range n {
+		base := i * upsertTechnologyColumns
+		values[i] = fmt.Sprintf("($%d, $%d)", base+1, base+2)
+	}
+
+	return fmt.Sprintf(upsertTechnologiesBatchQuery, strings.Join(values, ", "))
+}
+
 // GetByID retrieves a technology by its ID.
 func (r *Repository) GetByID(ctx context.Context, id int) (*Technology, error) {
 	tech := &Technology{}
@@ -136,6 +257,45 @@ func (r *Repository) GetByName(ctx context.Context, name string) (*Technology, e
 	return tech, nil
 }
 
+// GetByAliases resolves several aliases at once, returning the technology of each
+// alias that exists keyed by alias. Aliases without a match are absent from the
+// map, so callers can tell unknown names apart without one query per name.
+func (r *Repository) GetByAliases(ctx context.Context, aliases []string) (map[string]*Technology, error) {
+	technologies := make(map[string]*Technology, len(aliases))
+	if len(aliases) == 0 {
+		return technologies, nil
+	}
+
+	rows, err := r.db.Query(ctx, getTechnologiesByAliasesQuery, aliases)
+	if err != nil {
+		return nil, fmt.Errorf("failed to get technologies by aliases: %w", err)
+	}
+	defer rows.Close()
+
+	for rows.Next() {
+		var alias string
+		tech := &Technology{}
+		err = rows.Scan(
+			&alias,
+			&tech.ID,
+			&tech.Name,
+			&tech.Category,
+			&tech.ParentID,
+			&tech.CreatedAt,
+		)
+		if err != nil {
+			return nil, fmt.Errorf("failed to scan technology row: %w", err)
+		}
+		technologies[alias] = tech
+	}
+
+	if err = rows.Err(); err != nil {
+		return nil, fmt.Errorf("error iterating technology rows: %w", err)
+	}
+
+	return technologies, nil
+}
+
 // Update updates an existing technology in the database.
 func (r *Repository) Update(ctx context.Context, tech *Technology) error {
 	commandTag, err := r.db.Exec(
@@ -149,8 +309,7 @@ func (r *Repository) Update(ctx context.Context, tech *Technology) error {
 
 	if err != nil {
 		// Check for unique constraint violation (duplicate technology name)
-		var pgErr *pgconn.PgError
-		if errors.As(err, &pgErr) && pgErr.Code == "23505" {
+		if database.IsUniqueViolation(err) {
 			return &DuplicateError{Name: tech.Name}
 		}
 		return fmt.Errorf("failed to update technology: %w", err)
@@ -163,6 +322,21 @@ func (r *Repository) Update(ctx context.Context, tech *Technology) error {
 	return nil
 }
 
+// UpdateParent sets only the parent reference of a technology, leaving the
+// remaining columns untouched.
+func (r *Repository) UpdateParent(ctx context.Context, id int, parentID *int) error {
+	commandTag, err := r.db.Exec(ctx, updateTechnologyParentQuery, parentID, id)
+	if err != nil {
+		return fmt.Errorf("failed to update technology parent: %w", err)
+	}
+
+	if commandTag.RowsAffected() == 0 {
+		return &NotFoundError{ID: id}
+	}
+
+	return nil
+}
+
 // Delete removes a technology from the database.
 func (r *Repository) Delete(ctx context.Context, id int) error {
 	commandTag, err := r.db.Exec(ctx, deleteTechnologyQuery, id)
@@ -177,75 +351,155 @@ func (r *Repository) Delete(ctx context.Context, id int) error {
 	return nil
 }
 
-// GetWithAliases retrieves a technology by ID including its aliases.
-func (r *Repository) GetWithAliases(ctx context.Context, id int) (*Technology, error) {
-	tech, err := r.GetByID(ctx, id)
+// List retrieves up to limit technologies ordered by name, starting after
+// afterName. Pass an empty afterName for the first page and the name of the last
+// technology returned for the next one; each page is a range scan on the unique
+// name index regardless of depth.
+func (r *Repository) List(ctx context.Context, afterName string, limit int) ([]*Technology, error) {
+	rows, err := r.db.Query(ctx, listTechnologiesQuery, afterName, limit)
 	if err != nil {
-		return nil, err
+		return nil, fmt.Errorf("failed to list technologies: %w", err)
+	}
+	defer rows.Close()
+
+	technologies := make([]*Technology, 0, max(limit, 0))
+	for rows.Next() {
+		tech := &Technology{}
+		err = rows.Scan(
+			&tech.ID,
+			&tech.Name,
+			&tech.Category,
+			&tech.ParentID,
+			&tech.CreatedAt,
+		)
+		if err != nil {
+			return nil, fmt.Errorf("failed to scan technology row: %w", err)
+		}
+		technologies = append(technologies, tech)
+	}
+
+	if err = rows.Err(); err != nil {
+		return nil, fmt.Errorf("error iterating technology rows: %w", err)
 	}
 
-	rows, err := r.db.Query(ctx, getTechnologyAliasesQuery, tech.ID)
+	return technologies, nil
+}
+
+// GetWithAliases retrieves a technology by ID including its aliases.
+func (r *Repository) GetWithAliases(ctx context.Context, id int) (*Technology, error) {
+	rows, err := r.db.Query(ctx, getTechnologyWithAliasesQuery, id)
 	if err != nil {
-		return nil, fmt.Errorf("failed to get technology aliases: %w", err)
+		return nil, fmt.Errorf("failed to get technology with aliases: %w", err)
 	}
 	defer rows.Close()
 
-	var aliases []techalias.TechnologyAlias
+	var tech *Technology
 	for rows.Next() {
-		alias := techalias.TechnologyAlias{}
+		row := &Technology{}
+		var (
+			aliasID        *int
+			aliasTechID    *int
+			aliasName      *string
+			aliasCreatedAt *time.Time
+		)
 		err = rows.Scan(
-			&alias.ID,
-			&alias.TechnologyID,
-			&alias.Alias,
-			&alias.CreatedAt,
+			&row.ID,
+			&row.Name,
+			&row.Category,
+			&row.ParentID,
+			&row.CreatedAt,
+			&aliasID,
+			&aliasTechID,
+			&aliasName,
+			&aliasCreatedAt,
 		)
 		if err != nil {
-			return nil, fmt.Errorf("failed to scan alias row: %w", err)
+			return nil, fmt.Errorf("failed to scan technology alias row: %w", err)
+		}
+
+		// Technology columns repeat on every row; keep the first copy
+		if tech == nil {
+			tech = row
+		}
+		if aliasID != nil {
+			tech.Aliases = append(tech.Aliases, techalias.TechnologyAlias{
+				ID:           *aliasID,
+				TechnologyID: *aliasTechID,
+				Alias:        *aliasName,
+				CreatedAt:    *aliasCreatedAt,
+			})
 		}
-		aliases = append(aliases, alias)
 	}
 
 	if err = rows.Err(); err != nil {
-		return nil, fmt.Errorf("error iterating alias rows: %w", err)
+		return nil, fmt.Errorf("error iterating technology alias rows: %w", err)
+	}
+
+	if tech == nil {
+		return nil, &NotFoundError{ID: id}
 	}
 
-	tech.Aliases = aliases
 	return tech, nil
 }
 
 // GetWithJobs retrieves a technology by ID including its job associations.
 func (r *Repository) GetWithJobs(ctx context.Context, id int) (*Technology, error) {
-	tech, err := r.GetByID(ctx, id)
-	if err != nil {
-		return nil, err
-	}
-
-	rows, err := r.db.Query(ctx, getTechnologyJobsQuery, tech.ID)
+	rows, err := r.db.Query(ctx, getTechnologyWithJobsQuery, id)
 	if err != nil {
 		return nil, fmt.Errorf("failed to get technology jobs: %w", err)
 	}
 	defer rows.Close()
 
-	var jobs []jobtech.JobTechnology
+	var tech *Technology
 	for rows.Next() {
-		job := jobtech.JobTechnology{}
+		row := &Technology{}
+		var (
+			jobTechID        *int
+			jobID            *int
+			jobTechTechID    *int
+			jobTechRequired  *bool
+			jobTechCreatedAt *time.Time
+		)
 		err = rows.Scan(
-			&job.ID,
-			&job.JobID,
-			&job.TechnologyID,
-			&job.IsRequired,
-			&job.CreatedAt,
+			&row.ID,
+			&row.Name,
+			&row.Category,
+			&row.ParentID,
+			&row.CreatedAt,
+			&jobTechID,
+			&jobID,
+			&jobTechTechID,
+			&jobTechRequired,
+			&jobTechCreatedAt,
 		)
 		if err != nil {
 			return nil, fmt.Errorf("failed to scan job technology row: %w", err)
 		}
-		jobs = append(jobs, job)
+
+		// Technology columns repeat on every row; keep the first copy
+		if tech == nil {
+			tech = row
+		}
+		// Rows without an association, or with one that has no job, only carry
+		// the technology columns
+		if jobTechID != nil && jobID != nil && jobTechTechID != nil && jobTechCreatedAt != nil {
+			tech.Jobs = append(tech.Jobs, jobtech.JobTechnology{
+				ID:           *jobTechID,
+				JobID:        *jobID,
+				TechnologyID: *jobTechTechID,
+				IsRequired:   jobTechRequired != nil && *jobTechRequired,
+				CreatedAt:    *jobTechCreatedAt,
+			})
+		}
 	}
 
 	if err = rows.Err(); err != nil {
 		return nil, fmt.Errorf("error iterating job technology rows: %w", err)
 	}
 
-	tech.Jobs = jobs
+	if tech == nil {
+		return nil, &NotFoundError{ID: id}
+	}
+
 	return tech, nil
 }
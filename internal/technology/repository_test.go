@@ -129,6 +129,114 @@ func TestRepository_Create(t *testing.T) {
 	}
 }
 
+func TestRepository_UpsertBatch(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	tests := []struct {
+		name         string
+		techs        []*Technology
+		mockSetup    func(mock pgxmock.PgxPoolIface)
+		checkResults func(t *testing.T, techs []*Technology, err error)
+	}{
+		{
+			name: "successful batch upsert",
+			techs: []*Technology{
+				{Name: "go", Category: "Programming Language"},
+				{Name: "docker", Category: "Tool"},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertTechnologiesBatchQuery(2))).
+					WithArgs("go", "Programming Language", "docker", "Tool").
+					WillReturnRows(pgxmock.NewRows([]string{"id", "name", "created_at"}).
+						AddRow(1, "go", now).
+						AddRow(2, "docker", now))
+			},
+			checkResults: func(t *testing.T, techs []*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 1, techs[0].ID)
+				assert.Equal(t, 2, techs[1].ID)
+				assert.Equal(t, now, techs[1].CreatedAt)
+			},
+		},
+		{
+			name: "duplicate names are sent once",
+			techs: []*Technology{
+				{Name: "go", Category: "Tool"},
+				{Name: "go", Category: "Programming Language"},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertTechnologiesBatchQuery(1))).
+					WithArgs("go", "Programming Language").
+					WillReturnRows(pgxmock.NewRows([]string{"id", "name", "created_at"}).
+						AddRow(1, "go", now))
+			},
+			checkResults: func(t *testing.T, techs []*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Equal(t, 1, techs[0].ID)
+				assert.Equal(t, 1, techs[1].ID)
+			},
+		},
+		{
+			name:      "empty batch",
+			techs:     []*Technology{},
+			mockSetup: func(_ pgxmock.PgxPoolIface) {},
+			checkResults: func(t *testing.T, _ []*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+			},
+		},
+		{
+			name: "database error",
+			techs: []*Technology{
+				{Name: "go", Category: "Programming Language"},
+			},
+			mockSetup: func(mock pgxmock.PgxPoolIface) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(buildUpsertTechnologiesBatchQuery(1))).
+					WithArgs("go", "Programming Language").
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, _ []*Technology, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB)
+
+			err = repo.UpsertBatch(context.Background(), tt.techs)
+			tt.checkResults(t, tt.techs, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
+func TestBuildUpsertTechnologiesBatchQuery(t *testing.T) {
+	t.Parallel()
+
+	query := buildUpsertTechnologiesBatchQuery(2)
+
+	assert.Contains(t, query, "($1, $2), ($3, $4)")
+	assert.Contains(t, query, "ON CONFLICT (name) DO UPDATE SET category = EXCLUDED.category")
+}
+
 func TestRepository_GetByID(t *testing.T) {
 	t.Parallel()
 	now := time.Now()
@@ -360,6 +468,85 @@ func TestRepository_GetByName(t *testing.T) {
 	}
 }
 
+func TestRepository_GetByAliases(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	tests := []struct {
+		name         string
+		aliases      []string
+		mockSetup    func(mock pgxmock.PgxPoolIface, aliases []string)
+		checkResults func(t *testing.T, result map[string]*Technology, err error)
+	}{
+		{
+			name:    "resolves known aliases",
+			aliases: []string{"golang", "k8s", "unknown"},
+			mockSetup: func(mock pgxmock.PgxPoolIface, aliases []string) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologiesByAliasesQuery)).
+					WithArgs(aliases).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"alias", "id", "name", "category", "parent_id", "created_at",
+					}).
+						AddRow("golang", 1, "go", "Programming Language", nil, now).
+						AddRow("k8s", 2, "kubernetes", "Tool", nil, now))
+			},
+			checkResults: func(t *testing.T, result map[string]*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				require.Len(t, result, 2)
+				assert.Equal(t, "go", result["golang"].Name)
+				assert.Equal(t, "kubernetes", result["k8s"].Name)
+				assert.NotContains(t, result, "unknown")
+			},
+		},
+		{
+			name:      "no aliases skips the query",
+			aliases:   nil,
+			mockSetup: func(_ pgxmock.PgxPoolIface, _ []string) {},
+			checkResults: func(t *testing.T, result map[string]*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.Empty(t, result)
+			},
+		},
+		{
+			name:    "database error",
+			aliases: []string{"golang"},
+			mockSetup: func(mock pgxmock.PgxPoolIface, aliases []string) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologiesByAliasesQuery)).
+					WithArgs(aliases).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, result map[string]*Technology, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+				assert.Nil(t, result)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB, tt.aliases)
+
+			result, err := repo.GetByAliases(context.Background(), tt.aliases)
+			tt.checkResults(t, result, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
 func TestRepository_Update(t *testing.T) {
 	t.Parallel()
 	dbError := errors.New("database error")
@@ -498,6 +685,103 @@ func TestRepository_Update(t *testing.T) {
 	}
 }
 
+func TestRepository_UpdateParent(t *testing.T) {
+	t.Parallel()
+	dbError := errors.New("database error")
+	parentID := 5
+
+	tests := []struct {
+		name         string
+		id           int
+		parentID     *int
+		mockSetup    func(mock pgxmock.PgxPoolIface, id int, parentID *int)
+		checkResults func(t *testing.T, err error)
+	}{
+		{
+			name:     "successful parent update",
+			id:       1,
+			parentID: &parentID,
+			mockSetup: func(mock pgxmock.PgxPoolIface, id int, parentID *int) {
+				t.Helper()
+				mock.ExpectExec(regexp.QuoteMeta(updateTechnologyParentQuery)).
+					WithArgs(parentID, id).
+					WillReturnResult(pgxmock.NewResult("UPDATE", 1))
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.NoError(t, err)
+			},
+		},
+		{
+			name:     "clearing parent",
+			id:       2,
+			parentID: nil,
+			mockSetup: func(mock pgxmock.PgxPoolIface, id int, parentID *int) {
+				t.Helper()
+				mock.ExpectExec(regexp.QuoteMeta(updateTechnologyParentQuery)).
+					WithArgs(parentID, id).
+					WillReturnResult(pgxmock.NewResult("UPDATE", 1))
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.NoError(t, err)
+			},
+		},
+		{
+			name:     "technology not found",
+			id:       999,
+			parentID: &parentID,
+			mockSetup: func(mock pgxmock.PgxPoolIface, id int, parentID *int) {
+				t.Helper()
+				mock.ExpectExec(regexp.QuoteMeta(updateTechnologyParentQuery)).
+					WithArgs(parentID, id).
+					WillReturnResult(pgxmock.NewResult("UPDATE", 0))
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.Error(t, err)
+
+				var notFoundErr *NotFoundError
+				require.ErrorAs(t, err, &notFoundErr)
+				assert.Equal(t, 999, notFoundErr.ID)
+			},
+		},
+		{
+			name:     "database error",
+			id:       3,
+			parentID: &parentID,
+			mockSetup: func(mock pgxmock.PgxPoolIface, id int, parentID *int) {
+				t.Helper()
+				mock.ExpectExec(regexp.QuoteMeta(updateTechnologyParentQuery)).
+					WithArgs(parentID, id).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB, tt.id, tt.parentID)
+
+			err = repo.UpdateParent(context.Background(), tt.id, tt.parentID)
+			tt.checkResults(t, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
 func TestRepository_Delete(t *testing.T) {
 	t.Parallel()
 	dbError := errors.New("database error")
@@ -575,6 +859,96 @@ func TestRepository_Delete(t *testing.T) {
 	}
 }
 
+func TestRepository_List(t *testing.T) {
+	t.Parallel()
+	now := time.Now()
+	dbError := errors.New("database error")
+
+	tests := []struct {
+		name         string
+		afterName    string
+		limit        int
+		mockSetup    func(mock pgxmock.PgxPoolIface, afterName string, limit int)
+		checkResults func(t *testing.T, result []*Technology, err error)
+	}{
+		{
+			name:      "first page",
+			afterName: "",
+			limit:     2,
+			mockSetup: func(mock pgxmock.PgxPoolIface, afterName string, limit int) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(listTechnologiesQuery)).
+					WithArgs(afterName, limit).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "name", "category", "parent_id", "created_at",
+					}).
+						AddRow(1, "docker", "Tool", nil, now).
+						AddRow(2, "go", "Programming Language", nil, now))
+			},
+			checkResults: func(t *testing.T, result []*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				require.Len(t, result, 2)
+				assert.Equal(t, "docker", result[0].Name)
+				assert.Equal(t, "go", result[1].Name)
+			},
+		},
+		{
+			name:      "next page after last name",
+			afterName: "go",
+			limit:     2,
+			mockSetup: func(mock pgxmock.PgxPoolIface, afterName string, limit int) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(listTechnologiesQuery)).
+					WithArgs(afterName, limit).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "name", "category", "parent_id", "created_at",
+					}).AddRow(3, "python", "Programming Language", nil, now))
+			},
+			checkResults: func(t *testing.T, result []*Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				require.Len(t, result, 1)
+				assert.Equal(t, "python", result[0].Name)
+			},
+		},
+		{
+			name:      "database error",
+			afterName: "",
+			limit:     10,
+			mockSetup: func(mock pgxmock.PgxPoolIface, afterName string, limit int) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(listTechnologiesQuery)).
+					WithArgs(afterName, limit).
+					WillReturnError(dbError)
+			},
+			checkResults: func(t *testing.T, result []*Technology, err error) {
+				t.Helper()
+				require.Error(t, err)
+				require.ErrorIs(t, err, dbError)
+				assert.Nil(t, result)
+			},
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			t.Parallel()
+			mockDB, err := pgxmock.NewPool()
+			require.NoError(t, err)
+			defer mockDB.Close()
+
+			repo := NewRepository(mockDB)
+			tt.mockSetup(mockDB, tt.afterName, tt.limit)
+
+			result, err := repo.List(context.Background(), tt.afterName, tt.limit)
+			tt.checkResults(t, result, err)
+
+			require.NoError(t, mockDB.ExpectationsWereMet())
+		})
+	}
+}
+
 func TestRepository_GetWithAliases(t *testing.T) {
 	t.Parallel()
 	now := time.Now()
@@ -592,24 +966,15 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			id:   1,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"alias_id", "alias_technology_id", "alias", "alias_created_at",
 					}).AddRow(
-						id, "JavaScript", "Programming Language", nil, now,
-					))
-
-				// Second query to get the aliases
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyAliasesQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "technology_id", "alias", "created_at",
-					}).AddRow(
-						1, id, "JS", now,
+						id, "JavaScript", "Programming Language", nil, now, 2, id, "ECMAScript", now,
 					).AddRow(
-						2, id, "ECMAScript", now,
+						id, "JavaScript", "Programming Language", nil, now, 1, id, "JS", now,
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
@@ -623,8 +988,8 @@ func TestRepository_GetWithAliases(t *testing.T) {
 
 				// Check aliases
 				assert.Len(t, result.Aliases, 2)
-				assert.Equal(t, "JS", result.Aliases[0].Alias)
-				assert.Equal(t, "ECMAScript", result.Aliases[1].Alias)
+				assert.Equal(t, "ECMAScript", result.Aliases[0].Alias)
+				assert.Equal(t, "JS", result.Aliases[1].Alias)
 			},
 		},
 		{
@@ -632,22 +997,13 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			id:   2,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"alias_id", "alias_technology_id", "alias", "alias_created_at",
 					}).AddRow(
-						id, "React", "Framework", &parentID, now,
-					))
-
-				// Second query to get the aliases
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyAliasesQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "technology_id", "alias", "created_at",
-					}).AddRow(
-						3, id, "ReactJS", now,
+						id, "React", "Framework", &parentID, now, 3, id, "ReactJS", now,
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
@@ -663,6 +1019,7 @@ func TestRepository_GetWithAliases(t *testing.T) {
 				// Check aliases
 				assert.Len(t, result.Aliases, 1)
 				assert.Equal(t, "ReactJS", result.Aliases[0].Alias)
+				assert.Equal(t, 3, result.Aliases[0].ID)
 			},
 		},
 		{
@@ -670,9 +1027,12 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			id:   999,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
-					WillReturnError(pgx.ErrNoRows)
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "name", "category", "parent_id", "created_at",
+						"alias_id", "alias_technology_id", "alias", "alias_created_at",
+					}))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
 				t.Helper()
@@ -685,21 +1045,11 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			},
 		},
 		{
-			name: "technology found but error fetching aliases",
+			name: "database error",
 			id:   3,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "name", "category", "parent_id", "created_at",
-					}).AddRow(
-						id, "Python", "Programming Language", nil, now,
-					))
-
-				// Second query to get aliases returns error
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyAliasesQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
 					WillReturnError(dbError)
 			},
@@ -715,21 +1065,14 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			id:   4,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"alias_id", "alias_technology_id", "alias", "alias_created_at",
 					}).AddRow(
-						id, "Go", "Programming Language", nil, now,
+						id, "Go", "Programming Language", nil, now, nil, nil, nil, nil,
 					))
-
-				// Second query to get aliases returns empty result
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyAliasesQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "technology_id", "alias", "created_at",
-					}))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
 				t.Helper()
@@ -743,26 +1086,16 @@ func TestRepository_GetWithAliases(t *testing.T) {
 			},
 		},
 		{
-			name: "scan error in aliases",
+			name: "scan error",
 			id:   5,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "name", "category", "parent_id", "created_at",
-					}).AddRow(
-						id, "Ruby", "Programming Language", nil, now,
-					))
-
-				// Second query returns mismatched columns to cause scan error
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyAliasesQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithAliasesQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "technology_id", // Missing columns to cause scan error
+						"id", "name", // Missing columns to cause scan error
 					}).AddRow(
-						1, id,
+						id, "Ruby",
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
@@ -809,24 +1142,15 @@ func TestRepository_GetWithJobs(t *testing.T) {
 			id:   1,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"job_technology_id", "job_id", "technology_id", "is_required", "job_technology_created_at",
 					}).AddRow(
-						id, "Go", "Programming Language", nil, now,
-					))
-
-				// Second query to get the job associations
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyJobsQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "job_id", "technology_id", "is_required", "created_at",
-					}).AddRow(
-						1, 101, id, true, now,
+						id, "Go", "Programming Language", nil, now, 1, 101, id, true, now,
 					).AddRow(
-						2, 102, id, true, now,
+						id, "Go", "Programming Language", nil, now, 2, 102, id, true, now,
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
@@ -849,22 +1173,13 @@ func TestRepository_GetWithJobs(t *testing.T) {
 			id:   2,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"job_technology_id", "job_id", "technology_id", "is_required", "job_technology_created_at",
 					}).AddRow(
-						id, "React", "Framework", &parentID, now,
-					))
-
-				// Second query to get the job associations
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyJobsQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "job_id", "technology_id", "is_required", "created_at",
-					}).AddRow(
-						3, 201, id, false, now,
+						id, "React", "Framework", &parentID, now, 3, 201, id, false, now,
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
@@ -883,14 +1198,44 @@ func TestRepository_GetWithJobs(t *testing.T) {
 				assert.False(t, result.Jobs[0].IsRequired)
 			},
 		},
+		{
+			name: "association without a job is skipped",
+			id:   5,
+			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
+				t.Helper()
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
+					WithArgs(id).
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "name", "category", "parent_id", "created_at",
+						"job_technology_id", "job_id", "technology_id", "is_required", "job_technology_created_at",
+					}).AddRow(
+						id, "Rust", "Programming Language", nil, now, 4, 301, id, true, now,
+					).AddRow(
+						id, "Rust", "Programming Language", nil, now, 5, nil, id, false, now,
+					))
+			},
+			checkResults: func(t *testing.T, result *Technology, err error) {
+				t.Helper()
+				require.NoError(t, err)
+				assert.NotNil(t, result)
+				assert.Equal(t, 5, result.ID)
+
+				// Only the association with a job is returned
+				assert.Len(t, result.Jobs, 1)
+				assert.Equal(t, 301, result.Jobs[0].JobID)
+			},
+		},
 		{
 			name: "technology not found",
 			id:   999,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
-					WillReturnError(pgx.ErrNoRows)
+					WillReturnRows(pgxmock.NewRows([]string{
+						"id", "name", "category", "parent_id", "created_at",
+						"job_technology_id", "job_id", "technology_id", "is_required", "job_technology_created_at",
+					}))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
 				t.Helper()
@@ -903,21 +1248,11 @@ func TestRepository_GetWithJobs(t *testing.T) {
 			},
 		},
 		{
-			name: "technology found but error fetching jobs",
+			name: "database error",
 			id:   3,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "name", "category", "parent_id", "created_at",
-					}).AddRow(
-						id, "Python", "Programming Language", nil, now,
-					))
-
-				// Second query to get jobs returns error
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyJobsQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
 					WillReturnError(dbError)
 			},
@@ -933,21 +1268,14 @@ func TestRepository_GetWithJobs(t *testing.T) {
 			id:   4,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
 						"id", "name", "category", "parent_id", "created_at",
+						"job_technology_id", "job_id", "technology_id", "is_required", "job_technology_created_at",
 					}).AddRow(
-						id, "Ruby", "Programming Language", nil, now,
+						id, "Ruby", "Programming Language", nil, now, nil, nil, nil, nil, nil,
 					))
-
-				// Second query to get jobs returns empty result
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyJobsQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "job_id", "technology_id", "is_primary", "is_required", "created_at",
-					}))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
 				t.Helper()
@@ -961,26 +1289,17 @@ func TestRepository_GetWithJobs(t *testing.T) {
 			},
 		},
 		{
-			name: "scan error in jobs",
+			name: "scan error",
 			id:   5,
 			mockSetup: func(mock pgxmock.PgxPoolIface, id int) {
 				t.Helper()
-				// First query to get the technology
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyByIDQuery)).
-					WithArgs(id).
-					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "name", "category", "parent_id", "created_at",
-					}).AddRow(
-						id, "Java", "Programming Language", nil, now,
-					))
-
-				// Second query returns mismatched columns to cause scan error
-				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyJobsQuery)).
+				// Mismatched columns to cause scan error
+				mock.ExpectQuery(regexp.QuoteMeta(getTechnologyWithJobsQuery)).
 					WithArgs(id).
 					WillReturnRows(pgxmock.NewRows([]string{
-						"id", "job_id", "technology_id", // Missing columns to cause scan error
+						"id", "name", "category", // Missing columns to cause scan error
 					}).AddRow(
-						1, 103, id,
+						id, "Java", "Programming Language",
 					))
 			},
 			checkResults: func(t *testing.T, result *Technology, err error) {
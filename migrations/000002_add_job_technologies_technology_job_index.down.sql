@@ -0,0 +1,2 @@
+CREATE INDEX idx_job_technologies_technology_id ON job_technologies(technology_id);
+DROP INDEX IF EXISTS idx_job_technologies_technology_job;
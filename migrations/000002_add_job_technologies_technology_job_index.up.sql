@@ -0,0 +1,5 @@
+-- Composite index for filtering jobs by technology: the technology filter scans
+-- job_technologies by technology_id and groups by job_id, which this index
+-- serves without touching the table. It supersedes the single-column index.
+CREATE INDEX idx_job_technologies_technology_job ON job_technologies(technology_id, job_id);
+DROP INDEX IF EXISTS idx_job_technologies_technology_id;
@@ -0,0 +1 @@
+DROP INDEX IF EXISTS idx_jobs_active_created_at_id;
@@ -0,0 +1,4 @@
+-- Composite index backing keyset pagination of active jobs: the search orders by
+-- (created_at DESC, id DESC) and pages with a row-value comparison on the same
+-- columns, which this index serves with a single range scan.
+CREATE INDEX idx_jobs_active_created_at_id ON jobs(created_at DESC, id DESC) WHERE is_active = TRUE;
@@ -0,0 +1,6 @@
+CREATE INDEX IF NOT EXISTS idx_jobs_work_mode ON jobs(work_mode);
+CREATE INDEX IF NOT EXISTS idx_jobs_experience_level ON jobs(experience_level);
+CREATE INDEX IF NOT EXISTS idx_jobs_employment_type ON jobs(employment_type);
+DROP INDEX IF EXISTS idx_jobs_active_employment_type;
+DROP INDEX IF EXISTS idx_jobs_active_experience_level;
+DROP INDEX IF EXISTS idx_jobs_active_work_mode;
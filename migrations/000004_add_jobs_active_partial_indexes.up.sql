@@ -0,0 +1,9 @@
+-- Partial indexes over active jobs for the columns that back the search filters.
+-- Every read path filters on is_active = TRUE, so skipping inactive rows keeps these
+-- indexes small. They supersede the full single-column indexes.
+CREATE INDEX idx_jobs_active_work_mode ON jobs(work_mode) WHERE is_active = TRUE;
+CREATE INDEX idx_jobs_active_experience_level ON jobs(experience_level) WHERE is_active = TRUE;
+CREATE INDEX idx_jobs_active_employment_type ON jobs(employment_type) WHERE is_active = TRUE;
+DROP INDEX IF EXISTS idx_jobs_work_mode;
+DROP INDEX IF EXISTS idx_jobs_experience_level;
+DROP INDEX IF EXISTS idx_jobs_employment_type;
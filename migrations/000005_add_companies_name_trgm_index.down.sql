@@ -0,0 +1 @@
+DROP INDEX IF EXISTS idx_companies_name_trgm;
@@ -0,0 +1,5 @@
+-- Trigram index backing the job search company filter, which matches
+-- LOWER(name) LIKE LOWER('%term%'). A B-tree cannot serve a leading wildcard;
+-- a GIN trigram index on the same expression can.
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+CREATE INDEX idx_companies_name_trgm ON companies USING GIN (LOWER(name) gin_trgm_ops);
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_jobs_search_vector ON jobs USING GIN (search_vector);
+DROP INDEX IF EXISTS idx_jobs_active_search_vector;
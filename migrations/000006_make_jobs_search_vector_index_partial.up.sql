@@ -0,0 +1,5 @@
+-- Full-text search only ever matches active jobs, so index just that subset.
+-- The partial index is smaller and never returns inactive rows for the
+-- planner to filter out after the bitmap scan.
+CREATE INDEX idx_jobs_active_search_vector ON jobs USING GIN (search_vector) WHERE is_active = TRUE;
+DROP INDEX IF EXISTS idx_jobs_search_vector;
@@ -0,0 +1,2 @@
+CREATE INDEX IF NOT EXISTS idx_job_technologies_job_id ON job_technologies(job_id);
+DROP INDEX IF EXISTS idx_job_technologies_job_covering;
@@ -0,0 +1,6 @@
+-- Covering index for loading the technologies of a page of jobs: the batch
+-- query reads job_id, technology_id and is_required by job_id, all of which this
+-- index holds, so the job_technologies side of the join is index-only. It
+-- supersedes the single-column index.
+CREATE INDEX idx_job_technologies_job_covering ON job_technologies(job_id) INCLUDE (technology_id, is_required);
+DROP INDEX IF EXISTS idx_job_technologies_job_id;
@@ -1,15 +1,30 @@
 import asyncio
+import functools
 import json
 import os
 import sys
 from datetime import datetime
 from pathlib import Path
+from urllib.parse import urljoin, urlsplit
 import hashlib
 
 from dotenv import load_dotenv
 import openai
 from loguru import logger
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Page, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from stage_cache import (
+    prune_response_cache,
+    read_cached_response,
+    response_cache_file,
+    write_cached_response,
+)
+
+try:
+    import uvloop  # Faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
 # Get the root directory
 root_dir = Path(__file__).parent.parent.parent
@@ -20,6 +35,21 @@ load_dotenv(root_dir / ".env")
 # Configuration
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 MODEL = "o4-mini"  # OpenAI model to use
+# System message sent with every prompt
+SYSTEM_PROMPT = "You extract job href links from HTML content."
+MAX_CONCURRENT_COMPANIES = 2  # Career pages scraped and parsed at the same time
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}  # Never part of the page HTML
+# Nodes with no readable content, dropped from the extracted HTML; scripts and
+# inline SVGs often outweigh the text itself. JSON-LD scripts stay, as they hold
+# the structured job posting
+PRUNED_NODES = 'script:not([type="application/ld+json"]), style, svg'
+# Reads an element's HTML from a copy with PRUNED_NODES removed, so the live page,
+# which may still be rendering, is left untouched
+READ_PRUNED_HTML = """(element, [selector, outer]) => {
+    const copy = element.cloneNode(true);
+    copy.querySelectorAll(selector).forEach(node => node.remove());
+    return outer ? copy.outerHTML : copy.innerHTML;
+}"""
 
 # Define input directory path and input file name
 INPUT_DIR = Path("data/input")
@@ -33,6 +63,9 @@ OUTPUT_DIR = Path("data/output")
 timestamp = datetime.now().strftime("%Y%m%d")
 PIPELINE_OUTPUT_DIR = OUTPUT_DIR / timestamp / "pipeline_stage_1"
 PIPELINE_OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
+# OpenAI responses by prompt, kept across runs (see stage_cache.py)
+LLM_CACHE_DIR = OUTPUT_DIR / "llm_cache" / "pipeline_stage_1"
+LLM_CACHE_DIR.mkdir(exist_ok=True, parents=True)
 
 JOBS_FILE = "jobs_stage_1.json"  # JSON file with job details (just the filename)
 
@@ -41,18 +74,58 @@ LOG_LEVEL = "DEBUG"  # Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
 logger.remove()  # Remove default handler
 logger.add(sys.stderr, level=LOG_LEVEL)  # Add stderr handler with desired log level
 logger.add(
-    f"{PIPELINE_OUTPUT_DIR}/logs.log", rotation="10 MB", level=LOG_LEVEL
+    f"{PIPELINE_OUTPUT_DIR}/logs.log",
+    rotation="10 MB",
+    level=LOG_LEVEL,
+    enqueue=True,  # Write and rotate in a background thread, off the event loop
 )  # Add file handler
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
+# Initialize OpenAI client; the async client lets requests for different
+# pages overlap instead of blocking the event loop
+client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
+
+
+async def abort_unused_resources(route: Route):
+    """Abort requests for resources that never show up in the extracted HTML."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def extract_selector_html(page: Page, selector: str) -> str:
+    """
+    Wait for a selector to render and read the HTML of its first match.
+
+    Args:
+        page: The page to read from
+        selector: Playwright selector from the company configuration
+
+    Returns:
+        The inner HTML of the element, or None if it could not be read
+    """
+    try:
+        # Wait for the specific element to be available
+        element = await page.wait_for_selector(selector, timeout=5000)
+        if element:
+            # Get the HTML content of this element, without unreadable nodes
+            content = await element.evaluate(READ_PRUNED_HTML, [PRUNED_NODES, False])
+            logger.info(f"Successfully extracted content from selector: {selector}")
+            return content
+        logger.warning(f"Selector not found: {selector}")
+    except Exception as e:
+        logger.error(f"Error extracting content from selector {selector}: {str(e)}")
+    return None
 
 
-async def extract_html_content(url: str, selectors: list[str] = None) -> str:
+async def extract_html_content(
+    browser: Browser, url: str, selectors: list[str] = None
+) -> str:
     """
     Use Playwright to fetch HTML content from multiple selectors on a webpage.
 
     Args:
+        browser: Running browser shared by the whole run
         url: The URL to fetch content from
         selectors: List of CSS selectors to extract content from (optional)
 
@@ -61,52 +134,53 @@ async def extract_html_content(url: str, selectors: list[str] = None) -> str:
         or full page HTML if no selectors provided
     """
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
+        # A context per page keeps cookies and storage isolated without paying
+        # for a browser launch on every URL
+        async with await browser.new_context() as context:
+            # Skip downloading images, media and fonts; pages load faster and
+            # the HTML read below is the same
+            await context.route("**/*", abort_unused_resources)
+            page = await context.new_page()
 
             # Navigate to the URL
             logger.info(f"Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(3000)
+            # Give dynamic content a chance to settle, but don't stall on pages
+            # that keep polling; the selector path below waits for its elements
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Network still busy on {url}, continuing")
 
             if selectors:
-                contents = []
-                for selector in selectors:
-                    try:
-                        # Wait for the specific element to be available
-                        element = await page.wait_for_selector(selector, timeout=5000)
-                        if element:
-                            # Get the HTML content of this element
-                            content = await element.inner_html()
-                            contents.append(content)
-                            logger.info(
-                                f"Successfully extracted content from selector: {selector}"
-                            )
-                        else:
-                            logger.warning(f"Selector not found: {selector}")
-                    except Exception as e:
-                        logger.error(
-                            f"Error extracting content from selector {selector}: {str(e)}"
-                        )
+                # Drop repeated selectors, keeping their order
+                selectors = list(dict.fromkeys(selectors))
+
+                # Wait for and read every selector at the same time, so their
+                # waits overlap instead of adding up
+                matches = await asyncio.gather(
+                    *(extract_selector_html(page, selector) for selector in selectors)
+                )
+                contents = [match for match in matches if match is not None]
 
                 # Concatenate all contents with a newline between them
                 content = "\n".join(contents) if contents else None
             else:
                 # Get the full page content if no selectors specified
-                content = await page.content()
+                content = await page.locator("html").evaluate(
+                    READ_PRUNED_HTML, [PRUNED_NODES, True]
+                )
 
-            await browser.close()
             return content
     except Exception as e:
         logger.error(f"Error fetching {url}: {str(e)}")
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def read_prompt_template():
-    """Read the prompt template from a file."""
+    """Read the prompt template from a file, once per run."""
     try:
         with open(PROMPT_FILE, "r") as f:
             return f.read()
@@ -119,13 +193,13 @@ def read_prompt_template():
 
 
 async def process_company(
-    company_name: str, career_url: str, selectors: list[str] = None
+    browser: Browser, company_name: str, career_url: str, selectors: list[str] = None
 ):
     """Process a single company's career page."""
     logger.info(f"Processing {company_name}...")
 
     # Extract HTML content
-    html_content = await extract_html_content(career_url, selectors)
+    html_content = await extract_html_content(browser, career_url, selectors)
     if not html_content:
         logger.warning(f"Could not fetch content for {company_name}")
         return {
@@ -133,32 +207,36 @@ async def process_company(
             "error": "Failed to fetch HTML content",
         }
 
-    # Read prompt template and fill it with HTML content
-    prompt_template = read_prompt_template()
-    # Escape any curly braces in the HTML content
-    escaped_html = html_content.replace("{", "{{").replace("}", "}}")
-    filled_prompt = prompt_template.replace("{html_content}", escaped_html).replace(
-        "{career_url}", career_url
-    )
+    # Fill the prompt template around the HTML content; the template is
+    # filled by concatenation, so the HTML is inserted verbatim in one copy
+    prompt_template = read_prompt_template().replace("{career_url}", career_url)
+    prompt_prefix, _, prompt_suffix = prompt_template.partition("{html_content}")
+    filled_prompt = prompt_prefix + html_content + prompt_suffix
 
     # Send to OpenAI
     try:
-        logger.info(f"Sending content to OpenAI for {company_name}...")
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You extract job href links from HTML content.",
-                },
-                {"role": "user", "content": filled_prompt},
-            ],
-            response_format={"type": "json_object"},
+        # Reuse the response to an identical earlier request
+        cache_file = response_cache_file(
+            LLM_CACHE_DIR, MODEL, SYSTEM_PROMPT, filled_prompt
         )
+        job_data = read_cached_response(cache_file)
+        if job_data is not None:
+            logger.info(f"Using cached OpenAI response for {company_name}")
+        else:
+            logger.info(f"Sending content to OpenAI for {company_name}...")
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": filled_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
+            response_text = response.choices[0].message.content
 
-        # Parse response
-        response_text = response.choices[0].message.content
-        job_data = json.loads(response_text)
+            # Parse response, caching it only once it is known to be valid
+            job_data = json.loads(response_text)
+            write_cached_response(cache_file, response_text)
 
         # Add company metadata
         result = {
@@ -177,6 +255,42 @@ async def process_company(
         }
 
 
+async def process_company_with_limit(
+    semaphore: asyncio.Semaphore,
+    browser: Browser,
+    company_name: str,
+    career_url: str,
+    selectors: list[str] = None,
+):
+    """Process a company once a concurrency slot is free."""
+    async with semaphore:
+        result = await process_company(browser, company_name, career_url, selectors)
+
+        # Delay to avoid rate limiting
+        await asyncio.sleep(1)
+
+    return result
+
+
+def resolve_job_url(career_url: str, url: str) -> str:
+    """
+    Resolve a relative job link against the career page it was found on.
+    Absolute links are returned unchanged, and fragments are kept since
+    hash-routed career sites identify jobs by them.
+
+    Args:
+        career_url: The career page the link was found on
+        url: The job link as extracted from the page
+
+    Returns:
+        The absolute job URL
+    """
+    if not url or urlsplit(url).scheme:
+        return url
+
+    return urljoin(career_url, url)
+
+
 def generate_job_signature(url: str) -> str:
     """
     Generate a unique hash signature for a job URL.
@@ -299,6 +413,8 @@ def filter_new_jobs(companies_jobs: dict) -> dict:
 
 async def main():
     """Main function to process all companies."""
+    prune_response_cache(LLM_CACHE_DIR)
+
     # Check if prompt template file exists
     if not Path(PROMPT_FILE).exists():
         logger.error(f"Prompt template file '{PROMPT_FILE}' not found")
@@ -312,29 +428,43 @@ async def main():
         logger.error(f"Error reading input file: {str(e)}")
         return
 
-    # Process each company
     companies_jobs = {"companies": []}  # Initialize the structure for all jobs
 
-    # Process each company
+    # Collect the companies to process
+    valid_companies = []
     for company in companies:
         company_name = company.get("name")
         career_url = company.get("career_url")
-        job_board_selector = company.get("html_selectors", {}).get(
-            "job_board_selector", []
-        )
-        job_eligibility_selector = company.get("html_selectors", {}).get(
-            "job_eligibility_selector", []
-        )
-        job_description_selector = company.get("html_selectors", {}).get(
-            "job_description_selector", []
-        )
+        html_selectors = company.get("html_selectors", {})
 
         if not company_name or not career_url:
             logger.warning("Skipping entry with missing name or URL")
             continue
 
-        result = await process_company(company_name, career_url, job_board_selector)
+        valid_companies.append((company_name, career_url, html_selectors))
+
+    # Process the companies concurrently; results come back in input order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_COMPANIES)
+    async with async_playwright() as p:
+        # Launch the browser once and share it across all companies
+        browser = await p.chromium.launch()
+        results = await asyncio.gather(
+            *(
+                process_company_with_limit(
+                    semaphore,
+                    browser,
+                    company_name,
+                    career_url,
+                    html_selectors.get("job_board_selector", []),
+                )
+                for company_name, career_url, html_selectors in valid_companies
+            )
+        )
+        await browser.close()
 
+    for (company_name, career_url, html_selectors), result in zip(
+        valid_companies, results
+    ):
         # Check if there was an error or no jobs found
         if "error" in result:
             logger.error(f"Error processing {company_name}: {result['error']}")
@@ -344,26 +474,34 @@ async def main():
         if not result.get("jobs"):
             logger.warning(f"No jobs found for {company_name}")
 
-        # Generate signature for each job and filter out existing ones
+        # Generate signature for each job, skipping links to the same job
         jobs_with_signatures = []
+        seen_urls = set()
         for job in result.get("jobs", []):
-            signature = generate_job_signature(job.get("url", ""))
-            job["signature"] = signature
+            job_url = resolve_job_url(career_url, job.get("url", ""))
+            if job_url and job_url in seen_urls:
+                logger.debug(f"Skipping repeated job link: {job_url}")
+                continue
+            seen_urls.add(job_url)
+
+            job["url"] = job_url
+            job["signature"] = generate_job_signature(job_url)
             jobs_with_signatures.append(job)
 
         # Add to the all_jobs structure with filtered jobs
         companies_jobs["companies"].append(
             {
                 "company": company_name,
-                "job_eligibility_selector": job_eligibility_selector,
-                "job_description_selector": job_description_selector,
+                "job_eligibility_selector": html_selectors.get(
+                    "job_eligibility_selector", []
+                ),
+                "job_description_selector": html_selectors.get(
+                    "job_description_selector", []
+                ),
                 "jobs": jobs_with_signatures,
             }
         )
 
-        # Delay to avoid rate limiting
-        await asyncio.sleep(1)
-
     # Filter out jobs that were processed the previous day
     companies_jobs = filter_new_jobs(companies_jobs)
 
@@ -381,6 +519,9 @@ if __name__ == "__main__":
         exit(1)
 
     logger.info("Starting job link extraction process")
-    # Run the async main function
-    asyncio.run(main())
+    # Run the async main function, on uvloop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
     logger.info("Process completed")
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import os
 import sys
@@ -8,7 +9,21 @@ from pathlib import Path
 from dotenv import load_dotenv
 import openai
 from loguru import logger
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Page, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from stage_cache import (
+    job_html_file,
+    prune_response_cache,
+    read_cached_response,
+    response_cache_file,
+    write_cached_response,
+)
+
+try:
+    import uvloop  # Faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
 # Get the root directory
 root_dir = Path(__file__).parent.parent.parent
@@ -19,6 +34,21 @@ load_dotenv(root_dir / ".env")
 # Configuration
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 MODEL = "o4-mini"  # OpenAI model to use
+# System message sent with every prompt
+SYSTEM_PROMPT = "You extract job descriptions from HTML content."
+MAX_CONCURRENT_JOBS = 3  # Job pages scraped and parsed at the same time
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}  # Never part of the page HTML
+# Nodes with no readable content, dropped from the extracted HTML; scripts and
+# inline SVGs often outweigh the text itself. JSON-LD scripts stay, as they hold
+# the structured job posting
+PRUNED_NODES = 'script:not([type="application/ld+json"]), style, svg'
+# Reads an element's HTML from a copy with PRUNED_NODES removed, so the live page,
+# which may still be rendering, is left untouched
+READ_PRUNED_HTML = """(element, [selector, outer]) => {
+    const copy = element.cloneNode(true);
+    copy.querySelectorAll(selector).forEach(node => node.remove());
+    return outer ? copy.outerHTML : copy.innerHTML;
+}"""
 
 # Define input directory path and input file name
 INPUT_DIR = Path("data/input")
@@ -32,9 +62,14 @@ timestamp = datetime.now().strftime("%Y%m%d")
 PIPELINE_INPUT_DIR = OUTPUT_DIR / timestamp / "pipeline_stage_2"
 PIPELINE_OUTPUT_DIR = OUTPUT_DIR / timestamp / "pipeline_stage_3"
 PIPELINE_OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
+# OpenAI responses by prompt, kept across runs (see stage_cache.py)
+LLM_CACHE_DIR = OUTPUT_DIR / "llm_cache" / "pipeline_stage_3"
+LLM_CACHE_DIR.mkdir(exist_ok=True, parents=True)
 
 INPUT_FILE = "jobs_stage_2.json"  # JSON file with job eligibility data
 OUTPUT_FILE = "jobs_stage_3.json"  # JSON file with job descriptions
+HTML_CACHE_DIR = PIPELINE_OUTPUT_DIR / "html"  # Scraped job HTML, reused by stage 4
+HTML_CACHE_DIR.mkdir(exist_ok=True)
 
 # Configure logger
 LOG_LEVEL = "DEBUG"  # Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -44,17 +79,55 @@ logger.add(
     f"{PIPELINE_OUTPUT_DIR}/logs.log",
     rotation="10 MB",
     level=LOG_LEVEL,
+    enqueue=True,  # Write and rotate in a background thread, off the event loop
 )  # Add file handler
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
+# Initialize OpenAI client; the async client lets requests for different
+# pages overlap instead of blocking the event loop
+client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
 
 
-async def extract_html_content(url: str, selectors: list[str] = None) -> str:
+async def abort_unused_resources(route: Route):
+    """Abort requests for resources that never show up in the extracted HTML."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def extract_selector_html(page: Page, selector: str) -> str:
+    """
+    Wait for a selector to render and read the HTML of its first match.
+
+    Args:
+        page: The page to read from
+        selector: Playwright selector from the company configuration
+
+    Returns:
+        The inner HTML of the element, or None if it could not be read
+    """
+    try:
+        # Wait for the specific element to be available
+        element = await page.wait_for_selector(selector, timeout=5000)
+        if element:
+            # Get the HTML content of this element, without unreadable nodes
+            content = await element.evaluate(READ_PRUNED_HTML, [PRUNED_NODES, False])
+            logger.info(f"Successfully extracted content from selector: {selector}")
+            return content
+        logger.warning(f"Selector not found: {selector}")
+    except Exception as e:
+        logger.error(f"Error extracting content from selector {selector}: {str(e)}")
+    return None
+
+
+async def extract_html_content(
+    browser: Browser, url: str, selectors: list[str] = None
+) -> str:
     """
     Use Playwright to fetch HTML content from multiple selectors on a webpage.
 
     Args:
+        browser: Running browser shared by the whole run
         url: The URL to fetch content from
         selectors: List of CSS selectors to extract content from (optional)
 
@@ -63,52 +136,53 @@ async def extract_html_content(url: str, selectors: list[str] = None) -> str:
         or full page HTML if no selectors provided
     """
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
+        # A context per page keeps cookies and storage isolated without paying
+        # for a browser launch on every URL
+        async with await browser.new_context() as context:
+            # Skip downloading images, media and fonts; pages load faster and
+            # the HTML read below is the same
+            await context.route("**/*", abort_unused_resources)
+            page = await context.new_page()
 
             # Navigate to the URL
             logger.info(f"Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(3000)
+            # Give dynamic content a chance to settle, but don't stall on pages
+            # that keep polling; the selector path below waits for its elements
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Network still busy on {url}, continuing")
 
             if selectors:
-                contents = []
-                for selector in selectors:
-                    try:
-                        # Wait for the specific element to be available
-                        element = await page.wait_for_selector(selector, timeout=5000)
-                        if element:
-                            # Get the HTML content of this element
-                            content = await element.inner_html()
-                            contents.append(content)
-                            logger.info(
-                                f"Successfully extracted content from selector: {selector}"
-                            )
-                        else:
-                            logger.warning(f"Selector not found: {selector}")
-                    except Exception as e:
-                        logger.error(
-                            f"Error extracting content from selector {selector}: {str(e)}"
-                        )
+                # Drop repeated selectors, keeping their order
+                selectors = list(dict.fromkeys(selectors))
+
+                # Wait for and read every selector at the same time, so their
+                # waits overlap instead of adding up
+                matches = await asyncio.gather(
+                    *(extract_selector_html(page, selector) for selector in selectors)
+                )
+                contents = [match for match in matches if match is not None]
 
                 # Concatenate all contents with a newline between them
                 content = "\n".join(contents) if contents else None
             else:
                 # Get the full page content if no selectors specified
-                content = await page.content()
+                content = await page.locator("html").evaluate(
+                    READ_PRUNED_HTML, [PRUNED_NODES, True]
+                )
 
-            await browser.close()
             return content
     except Exception as e:
         logger.error(f"Error fetching {url}: {str(e)}")
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def read_prompt_template():
-    """Read the prompt template from a file."""
+    """Read the prompt template from a file, once per run."""
     try:
         with open(PROMPT_FILE, "r") as f:
             return f.read()
@@ -120,43 +194,67 @@ def read_prompt_template():
         exit(1)
 
 
-async def process_job(job_url: str, selectors: list[str], company_name: str):
+def save_html_content(job_url: str, html_content: str) -> None:
+    """
+    Save the HTML scraped for a job so stage 4 can read it instead of loading
+    the same page section again.
+
+    Args:
+        job_url: The job URL the HTML was scraped from
+        html_content: The scraped HTML content
+    """
+    cache_file = job_html_file(HTML_CACHE_DIR, job_url)
+    try:
+        cache_file.write_text(html_content, encoding="utf-8")
+    except Exception as e:
+        logger.warning(f"Could not cache HTML for job at {job_url}: {str(e)}")
+
+
+async def process_job(
+    browser: Browser, job_url: str, selectors: list[str], company_name: str
+):
     """Process a single job URL to extract job description."""
     logger.info(f"Processing job at {job_url} for {company_name}...")
 
     # Extract HTML content
-    html_content = await extract_html_content(job_url, selectors)
+    html_content = await extract_html_content(browser, job_url, selectors)
     if not html_content:
         logger.warning(f"Could not fetch content for job at {job_url}")
         return {
             "description": None,
             "error": "Failed to fetch HTML content",
         }
+    save_html_content(job_url, html_content)
 
-    # Read prompt template and fill it with HTML content
-    prompt_template = read_prompt_template()
-    # Escape any curly braces in the HTML content
-    escaped_html = html_content.replace("{", "{{").replace("}", "}}")
-    filled_prompt = prompt_template.replace("{html_content}", escaped_html)
+    # Fill the prompt template around the HTML content; the template is
+    # filled by concatenation, so the HTML is inserted verbatim in one copy
+    prompt_prefix, _, prompt_suffix = read_prompt_template().partition("{html_content}")
+    filled_prompt = prompt_prefix + html_content + prompt_suffix
 
     # Send to OpenAI
     try:
-        logger.info(f"Sending content to OpenAI for job at {job_url}...")
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You extract job descriptions from HTML content.",
-                },
-                {"role": "user", "content": filled_prompt},
-            ],
-            response_format={"type": "json_object"},
+        # Reuse the response to an identical earlier request
+        cache_file = response_cache_file(
+            LLM_CACHE_DIR, MODEL, SYSTEM_PROMPT, filled_prompt
         )
-
-        # Parse response
-        response_text = response.choices[0].message.content
-        description_data = json.loads(response_text)
+        description_data = read_cached_response(cache_file)
+        if description_data is not None:
+            logger.info(f"Using cached OpenAI response for job at {job_url}")
+        else:
+            logger.info(f"Sending content to OpenAI for job at {job_url}...")
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": filled_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
+            response_text = response.choices[0].message.content
+
+            # Parse response, caching it only once it is known to be valid
+            description_data = json.loads(response_text)
+            write_cached_response(cache_file, response_text)
 
         # Add metadata
         result = {
@@ -175,8 +273,27 @@ async def process_job(job_url: str, selectors: list[str], company_name: str):
         }
 
 
+async def process_job_with_limit(
+    semaphore: asyncio.Semaphore,
+    browser: Browser,
+    job_url: str,
+    selectors: list[str],
+    company_name: str,
+):
+    """Process a job once a concurrency slot is free."""
+    async with semaphore:
+        result = await process_job(browser, job_url, selectors, company_name)
+
+        # Delay to avoid rate limiting
+        await asyncio.sleep(1)
+
+    return result
+
+
 async def main():
     """Main function to process all jobs."""
+    prune_response_cache(LLM_CACHE_DIR)
+
     # Check if prompt template file exists
     if not Path(PROMPT_FILE).exists():
         logger.error(f"Prompt template file '{PROMPT_FILE}' not found")
@@ -201,7 +318,9 @@ async def main():
     total_jobs_processed = 0
     jobs_with_descriptions = 0
 
-    for job in data.get("jobs", []):
+    # Collect the eligible jobs to process; the rest pass through unchanged
+    pending_jobs = {}
+    for index, job in enumerate(data.get("jobs", [])):
         job_url = job.get("application_url", "")
         job_title = job.get("title", "")
         company_name = job.get("company", "")
@@ -210,16 +329,37 @@ async def main():
         # Only process eligible jobs
         if not job.get("eligible", False):
             logger.debug(f"Skipping ineligible job: {job_title}")
-            processed_jobs.append(job)
             continue
 
         if not job_url:
             logger.warning(f"Job missing URL, skipping: {job_title}")
-            processed_jobs.append(job)
             continue
 
         logger.info(f"Processing new eligible job: {job_title} at {job_url}")
-        result = await process_job(job_url, job_description_selector, company_name)
+        pending_jobs[index] = (job_url, job_description_selector, company_name)
+
+    # Process the jobs concurrently; results come back in input order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    async with async_playwright() as p:
+        # Launch the browser once and share it across all jobs
+        browser = await p.chromium.launch()
+        results = await asyncio.gather(
+            *(
+                process_job_with_limit(semaphore, browser, *pending_job)
+                for pending_job in pending_jobs.values()
+            )
+        )
+        await browser.close()
+    results_by_index = dict(zip(pending_jobs, results))
+
+    # Merge the results back in input order
+    for index, job in enumerate(data.get("jobs", [])):
+        if index not in results_by_index:
+            processed_jobs.append(job)
+            continue
+
+        job_title = job.get("title", "")
+        result = results_by_index[index]
 
         total_jobs_processed += 1
 
@@ -241,9 +381,6 @@ async def main():
         # Add job to processed jobs list (whether description was extracted or not)
         processed_jobs.append(job)
 
-        # Delay to avoid rate limiting
-        await asyncio.sleep(1)
-
     # Save results
     output_file = PIPELINE_OUTPUT_DIR / OUTPUT_FILE
     with open(output_file, "w", encoding="utf-8") as f:
@@ -266,6 +403,9 @@ if __name__ == "__main__":
         exit(1)
 
     logger.info("Starting job description extraction process")
-    # Run the async main function
-    asyncio.run(main())
+    # Run the async main function, on uvloop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
     logger.info("Process completed")
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import json
 import os
 import sys
@@ -8,7 +9,21 @@ from pathlib import Path
 from dotenv import load_dotenv
 import openai
 from loguru import logger
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Page, Route, async_playwright
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+
+from stage_cache import (
+    job_html_file,
+    prune_response_cache,
+    read_cached_response,
+    response_cache_file,
+    write_cached_response,
+)
+
+try:
+    import uvloop  # Faster event loop; not available on Windows
+except ImportError:
+    uvloop = None
 
 # Get the root directory
 root_dir = Path(__file__).parent.parent.parent
@@ -19,6 +34,21 @@ load_dotenv(root_dir / ".env")
 # Configuration
 OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 MODEL = "o4-mini"  # OpenAI model to use
+# System message sent with every prompt
+SYSTEM_PROMPT = "You extract technologies from job postings."
+MAX_CONCURRENT_JOBS = 3  # Job pages scraped and parsed at the same time
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}  # Never part of the page HTML
+# Nodes with no readable content, dropped from the extracted HTML; scripts and
+# inline SVGs often outweigh the text itself. JSON-LD scripts stay, as they hold
+# the structured job posting
+PRUNED_NODES = 'script:not([type="application/ld+json"]), style, svg'
+# Reads an element's HTML from a copy with PRUNED_NODES removed, so the live page,
+# which may still be rendering, is left untouched
+READ_PRUNED_HTML = """(element, [selector, outer]) => {
+    const copy = element.cloneNode(true);
+    copy.querySelectorAll(selector).forEach(node => node.remove());
+    return outer ? copy.outerHTML : copy.innerHTML;
+}"""
 
 # Define input directory path and input file name
 INPUT_DIR = Path("data/input")
@@ -32,9 +62,13 @@ timestamp = datetime.now().strftime("%Y%m%d")
 PIPELINE_INPUT_DIR = OUTPUT_DIR / timestamp / "pipeline_stage_3"
 PIPELINE_OUTPUT_DIR = OUTPUT_DIR / timestamp / "pipeline_stage_4"
 PIPELINE_OUTPUT_DIR.mkdir(exist_ok=True, parents=True)
+# OpenAI responses by prompt, kept across runs (see stage_cache.py)
+LLM_CACHE_DIR = OUTPUT_DIR / "llm_cache" / "pipeline_stage_4"
+LLM_CACHE_DIR.mkdir(exist_ok=True, parents=True)
 
 INPUT_FILE = "jobs_stage_3.json"  # JSON file with job descriptions
 OUTPUT_FILE = "jobs_stage_4.json"  # JSON file with job technologies
+HTML_CACHE_DIR = PIPELINE_INPUT_DIR / "html"  # Job HTML scraped by stage 3
 
 # Configure logger
 LOG_LEVEL = "DEBUG"  # Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
@@ -44,17 +78,55 @@ logger.add(
     f"{PIPELINE_OUTPUT_DIR}/logs.log",
     rotation="10 MB",
     level=LOG_LEVEL,
+    enqueue=True,  # Write and rotate in a background thread, off the event loop
 )  # Add file handler
 
-# Initialize OpenAI client
-client = openai.OpenAI(api_key=OPENAI_API_KEY)
+# Initialize OpenAI client; the async client lets requests for different
+# pages overlap instead of blocking the event loop
+client = openai.AsyncOpenAI(api_key=OPENAI_API_KEY)
 
 
-async def extract_html_content(url: str, selectors: list[str] = None) -> str:
+async def abort_unused_resources(route: Route):
+    """Abort requests for resources that never show up in the extracted HTML."""
+    if route.request.resource_type in BLOCKED_RESOURCE_TYPES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def extract_selector_html(page: Page, selector: str) -> str:
+    """
+    Wait for a selector to render and read the HTML of its first match.
+
+    Args:
+        page: The page to read from
+        selector: Playwright selector from the company configuration
+
+    Returns:
+        The inner HTML of the element, or None if it could not be read
+    """
+    try:
+        # Wait for the specific element to be available
+        element = await page.wait_for_selector(selector, timeout=5000)
+        if element:
+            # Get the HTML content of this element, without unreadable nodes
+            content = await element.evaluate(READ_PRUNED_HTML, [PRUNED_NODES, False])
+            logger.info(f"Successfully extracted content from selector: {selector}")
+            return content
+        logger.warning(f"Selector not found: {selector}")
+    except Exception as e:
+        logger.error(f"Error extracting content from selector {selector}: {str(e)}")
+    return None
+
+
+async def extract_html_content(
+    browser: Browser, url: str, selectors: list[str] = None
+) -> str:
     """
     Use Playwright to fetch HTML content from multiple selectors on a webpage.
 
     Args:
+        browser: Running browser shared by the whole run
         url: The URL to fetch content from
         selectors: List of CSS selectors to extract content from (optional)
 
@@ -63,52 +135,53 @@ async def extract_html_content(url: str, selectors: list[str] = None) -> str:
         or full page HTML if no selectors provided
     """
     try:
-        async with async_playwright() as p:
-            browser = await p.chromium.launch()
-            page = await browser.new_page()
+        # A context per page keeps cookies and storage isolated without paying
+        # for a browser launch on every URL
+        async with await browser.new_context() as context:
+            # Skip downloading images, media and fonts; pages load faster and
+            # the HTML read below is the same
+            await context.route("**/*", abort_unused_resources)
+            page = await context.new_page()
 
             # Navigate to the URL
             logger.info(f"Navigating to {url}")
-            await page.goto(url, wait_until="networkidle", timeout=60000)
+            await page.goto(url, wait_until="domcontentloaded", timeout=60000)
 
-            # Wait a bit for any dynamic content to load
-            await page.wait_for_timeout(3000)
+            # Give dynamic content a chance to settle, but don't stall on pages
+            # that keep polling; the selector path below waits for its elements
+            try:
+                await page.wait_for_load_state("networkidle", timeout=5000)
+            except PlaywrightTimeoutError:
+                logger.debug(f"Network still busy on {url}, continuing")
 
             if selectors:
-                contents = []
-                for selector in selectors:
-                    try:
-                        # Wait for the specific element to be available
-                        element = await page.wait_for_selector(selector, timeout=5000)
-                        if element:
-                            # Get the HTML content of this element
-                            content = await element.inner_html()
-                            contents.append(content)
-                            logger.info(
-                                f"Successfully extracted content from selector: {selector}"
-                            )
-                        else:
-                            logger.warning(f"Selector not found: {selector}")
-                    except Exception as e:
-                        logger.error(
-                            f"Error extracting content from selector {selector}: {str(e)}"
-                        )
+                # Drop repeated selectors, keeping their order
+                selectors = list(dict.fromkeys(selectors))
+
+                # Wait for and read every selector at the same time, so their
+                # waits overlap instead of adding up
+                matches = await asyncio.gather(
+                    *(extract_selector_html(page, selector) for selector in selectors)
+                )
+                contents = [match for match in matches if match is not None]
 
                 # Concatenate all contents with a newline between them
                 content = "\n".join(contents) if contents else None
             else:
                 # Get the full page content if no selectors specified
-                content = await page.content()
+                content = await page.locator("html").evaluate(
+                    READ_PRUNED_HTML, [PRUNED_NODES, True]
+                )
 
-            await browser.close()
             return content
     except Exception as e:
         logger.error(f"Error fetching {url}: {str(e)}")
         return None
 
 
+@functools.lru_cache(maxsize=None)
 def read_prompt_template():
-    """Read the prompt template from a file."""
+    """Read the prompt template from a file, once per run."""
     try:
         with open(PROMPT_FILE, "r") as f:
             return f.read()
@@ -120,12 +193,37 @@ def read_prompt_template():
         exit(1)
 
 
-async def process_job(job_url: str, selectors: list[str], company_name: str):
+def load_html_content(job_url: str) -> str:
+    """
+    Load the HTML stage 3 scraped for a job. Both stages read the job
+    description selectors, so the saved HTML is the content this stage needs.
+
+    Args:
+        job_url: The job URL the HTML was scraped from
+
+    Returns:
+        The cached HTML content, or None if stage 3 did not save any
+    """
+    cache_file = job_html_file(HTML_CACHE_DIR, job_url)
+    try:
+        return cache_file.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Could not read cached HTML for job at {job_url}: {str(e)}")
+        return None
+
+
+async def process_job(
+    browser: Browser, job_url: str, selectors: list[str], company_name: str
+):
     """Process a single job URL to extract technologies."""
     logger.info(f"Processing job at {job_url} for {company_name}...")
 
-    # Extract HTML content
-    html_content = await extract_html_content(job_url, selectors)
+    # Extract HTML content, reusing what stage 3 scraped when available
+    html_content = load_html_content(job_url)
+    if html_content is None:
+        html_content = await extract_html_content(browser, job_url, selectors)
     if not html_content:
         logger.warning(f"Could not fetch content for job at {job_url}")
         return {
@@ -133,30 +231,35 @@ async def process_job(job_url: str, selectors: list[str], company_name: str):
             "error": "Failed to fetch HTML content",
         }
 
-    # Read prompt template and fill it with HTML content
-    prompt_template = read_prompt_template()
-    # Escape any curly braces in the HTML content
-    escaped_html = html_content.replace("{", "{{").replace("}", "}}")
-    filled_prompt = prompt_template.replace("{html_content}", escaped_html)
+    # Fill the prompt template around the HTML content; the template is
+    # filled by concatenation, so the HTML is inserted verbatim in one copy
+    prompt_prefix, _, prompt_suffix = read_prompt_template().partition("{html_content}")
+    filled_prompt = prompt_prefix + html_content + prompt_suffix
 
     # Send to OpenAI
     try:
-        logger.info(f"Sending content to OpenAI for job at {job_url}...")
-        response = client.chat.completions.create(
-            model=MODEL,
-            messages=[
-                {
-                    "role": "system",
-                    "content": "You extract technologies from job postings.",
-                },
-                {"role": "user", "content": filled_prompt},
-            ],
-            response_format={"type": "json_object"},
+        # Reuse the response to an identical earlier request
+        cache_file = response_cache_file(
+            LLM_CACHE_DIR, MODEL, SYSTEM_PROMPT, filled_prompt
         )
+        tech_data = read_cached_response(cache_file)
+        if tech_data is not None:
+            logger.info(f"Using cached OpenAI response for job at {job_url}")
+        else:
+            logger.info(f"Sending content to OpenAI for job at {job_url}...")
+            response = await client.chat.completions.create(
+                model=MODEL,
+                messages=[
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": filled_prompt},
+                ],
+                response_format={"type": "json_object"},
+            )
+            response_text = response.choices[0].message.content
 
-        # Parse response
-        response_text = response.choices[0].message.content
-        tech_data = json.loads(response_text)
+            # Parse response, caching it only once it is known to be valid
+            tech_data = json.loads(response_text)
+            write_cached_response(cache_file, response_text)
 
         # Add metadata
         result = {
@@ -175,6 +278,23 @@ async def process_job(job_url: str, selectors: list[str], company_name: str):
         }
 
 
+async def process_job_with_limit(
+    semaphore: asyncio.Semaphore,
+    browser: Browser,
+    job_url: str,
+    selectors: list[str],
+    company_name: str,
+):
+    """Process a job once a concurrency slot is free."""
+    async with semaphore:
+        result = await process_job(browser, job_url, selectors, company_name)
+
+        # Delay to avoid rate limiting
+        await asyncio.sleep(1)
+
+    return result
+
+
 def manage_past_jobs_signatures(combined_signatures: set) -> None:
     """
     Manage historical jobs signatures by combining with previous day's data and detecting duplicates.
@@ -273,6 +393,8 @@ def manage_past_jobs_signatures(combined_signatures: set) -> None:
 
 async def main():
     """Main function to process all jobs."""
+    prune_response_cache(LLM_CACHE_DIR)
+
     # Check if prompt template file exists
     if not Path(PROMPT_FILE).exists():
         logger.error(f"Prompt template file '{PROMPT_FILE}' not found")
@@ -298,50 +420,67 @@ async def main():
     jobs_with_technologies = 0
     processed_signatures = set()
 
-    for job in data.get("jobs", []):
+    # Collect the jobs to process; jobs without a URL pass through unchanged
+    pending_jobs = {}
+    for index, job in enumerate(data.get("jobs", [])):
         job_url = job.get("application_url", "")
         job_title = job.get("title", "")
         company_name = job.get("company", "")
-        job_signature = job.get("signature", "")
         job_description_selector = job.get("job_description_selector", [])
 
         if not job_url:
             logger.warning(f"Job missing URL, skipping: {job_title}")
-            # Create a clean job object without the excluded fields
-            clean_job = {
-                k: v
-                for k, v in job.items()
-                if k not in ["job_description_selector", "eligible"]
-            }
-            processed_jobs.append(clean_job)
             continue
 
         logger.info(f"Processing new job: {job_title} at {job_url}")
-        result = await process_job(job_url, job_description_selector, company_name)
+        pending_jobs[index] = (job_url, job_description_selector, company_name)
+
+    # Process the jobs concurrently; results come back in input order
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_JOBS)
+    async with async_playwright() as p:
+        # Launch the browser once and share it across all jobs
+        browser = await p.chromium.launch()
+        results = await asyncio.gather(
+            *(
+                process_job_with_limit(semaphore, browser, *pending_job)
+                for pending_job in pending_jobs.values()
+            )
+        )
+        await browser.close()
+    results_by_index = dict(zip(pending_jobs, results))
 
-        total_jobs_processed += 1
+    # Merge the results back in input order
+    for index, job in enumerate(data.get("jobs", [])):
+        if index in results_by_index:
+            job_title = job.get("title", "")
+            job_signature = job.get("signature", "")
+            result = results_by_index[index]
 
-        # Check if there was an error
-        if "error" in result:
-            logger.error(f"Error processing job {job_title}: {result['error']}")
-            # Add empty technologies array if extraction failed
-            job["technologies"] = []
-        else:
-            if result and result["technologies"]:
-                jobs_with_technologies += 1
-                # Add technologies to job data
-                job["technologies"] = result["technologies"]
-                logger.info(
-                    f"Added {len(result['technologies'])} technologies to job: {job_title}"
-                )
-            else:
+            total_jobs_processed += 1
+
+            # Check if there was an error
+            if "error" in result:
+                logger.error(f"Error processing job {job_title}: {result['error']}")
                 # Add empty technologies array if extraction failed
                 job["technologies"] = []
-                logger.warning(f"Failed to extract technologies for job: {job_title}")
-
-        # Add signature to processed signatures
-        if job_signature:
-            processed_signatures.add(job_signature)
+            else:
+                if result and result["technologies"]:
+                    jobs_with_technologies += 1
+                    # Add technologies to job data
+                    job["technologies"] = result["technologies"]
+                    logger.info(
+                        f"Added {len(result['technologies'])} technologies to job: {job_title}"
+                    )
+                else:
+                    # Add empty technologies array if extraction failed
+                    job["technologies"] = []
+                    logger.warning(
+                        f"Failed to extract technologies for job: {job_title}"
+                    )
+
+            # Add signature to processed signatures
+            if job_signature:
+                processed_signatures.add(job_signature)
 
         # Create a clean job object without the excluded fields
         clean_job = {
@@ -353,9 +492,6 @@ async def main():
         # Add job to final jobs list
         processed_jobs.append(clean_job)
 
-        # Delay to avoid rate limiting
-        await asyncio.sleep(1)
-
     # Manage past jobs signatures with duplicate detection
     manage_past_jobs_signatures(processed_signatures)
 
@@ -381,6 +517,9 @@ if __name__ == "__main__":
         exit(1)
 
     logger.info("Starting job technologies extraction process")
-    # Run the async main function
-    asyncio.run(main())
+    # Run the async main function, on uvloop when installed
+    if uvloop is not None:
+        uvloop.run(main())
+    else:
+        asyncio.run(main())
     logger.info("Process completed")
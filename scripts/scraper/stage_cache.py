@@ -0,0 +1,119 @@
+"""Caches shared by the job pipeline stages: OpenAI responses and scraped job HTML."""
+
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+from loguru import logger
+
+# Bump when a prompt template or the parsing of responses changes, so answers in
+# the old shape are requested again instead of being served from the cache
+RESPONSE_CACHE_VERSION = 1
+RESPONSE_CACHE_TTL = 7 * 24 * 60 * 60  # Seconds a cached response is reused for
+# Run a stage with --no-cache to ignore cached responses; the fresh responses
+# replace the cached ones
+RESPONSE_CACHE_ENABLED = "--no-cache" not in sys.argv[1:]
+
+
+def response_cache_file(
+    cache_dir: Path, model: str, system_prompt: str, filled_prompt: str
+) -> Path:
+    """
+    Get the file caching the OpenAI response to a prompt. Reposted jobs and
+    unchanged pages produce the same prompt, so their response can be reused.
+
+    Args:
+        cache_dir: The response cache directory of the stage
+        model: The model the prompt is sent to
+        system_prompt: The system message sent with the prompt
+        filled_prompt: The prompt sent to the model
+
+    Returns:
+        Path of the cache file for this cache version, model, system message
+        and prompt
+    """
+    key = hashlib.sha256(
+        f"{RESPONSE_CACHE_VERSION}:{model}:{system_prompt}:{filled_prompt}".encode()
+    ).hexdigest()
+    return cache_dir / f"{key}.json"
+
+
+def read_cached_response(cache_file: Path) -> dict:
+    """
+    Load a cached OpenAI response. Unreadable and expired entries are deleted,
+    so their prompt is sent to OpenAI again.
+
+    Args:
+        cache_file: The cache file of the prompt
+
+    Returns:
+        The parsed response, or None if there is no usable cached response or
+        the cache is disabled
+    """
+    if not RESPONSE_CACHE_ENABLED:
+        return None
+    try:
+        if time.time() - cache_file.stat().st_mtime > RESPONSE_CACHE_TTL:
+            cache_file.unlink(missing_ok=True)
+            return None
+        return json.loads(cache_file.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Discarding unreadable cached response {cache_file}: {str(e)}")
+        cache_file.unlink(missing_ok=True)
+        return None
+
+
+def write_cached_response(cache_file: Path, response_text: str) -> None:
+    """
+    Cache an OpenAI response. The response is written to a temporary file
+    first and moved into place, so an interrupted run never leaves a
+    partial entry behind.
+
+    Args:
+        cache_file: The cache file of the prompt
+        response_text: The raw response, already known to be valid JSON
+    """
+    temp_file = cache_file.with_suffix(".tmp")
+    temp_file.write_text(response_text, encoding="utf-8")
+    os.replace(temp_file, cache_file)
+
+
+def prune_response_cache(cache_dir: Path) -> None:
+    """
+    Delete expired cached responses, so entries for prompts that never come
+    back do not pile up.
+
+    Args:
+        cache_dir: The response cache directory of the stage
+    """
+    expired_before = time.time() - RESPONSE_CACHE_TTL
+    removed = 0
+    for cache_file in cache_dir.iterdir():
+        try:
+            if cache_file.stat().st_mtime < expired_before:
+                cache_file.unlink()
+                removed += 1
+        except FileNotFoundError:
+            continue
+    if removed:
+        logger.info(f"Removed {removed} expired cached responses from {cache_dir}")
+
+
+def job_html_file(html_dir: Path, job_url: str) -> Path:
+    """
+    Get the file holding the HTML scraped for a job. Stage 3 writes it and
+    stage 4 reads it, so both must name it the same way.
+
+    Args:
+        html_dir: The HTML directory of the stage 3 output
+        job_url: The job URL the HTML was scraped from
+
+    Returns:
+        Path of the HTML file for the job
+    """
+    return html_dir / f"{hashlib.sha256(job_url.encode()).hexdigest()}.html"